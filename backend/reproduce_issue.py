@@ -1,4 +1,9 @@
-from src.models.resume import Resume
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from models.resume import Resume
 import json
 import traceback
 
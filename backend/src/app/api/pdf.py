@@ -6,18 +6,76 @@ Generates ATS-friendly PDFs and DOCX files using HTML templates + WeasyPrint
 - 100% format consistency between formats
 """
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import Response
-from datetime import datetime
+from pydantic import TypeAdapter, ValidationError
+from datetime import date
+from urllib.parse import quote
+import asyncio
 
 from models.resume import GeneratePDFRequest
 # NEW: Use template-based generator
 from services.template_document_generator import get_template_generator
-from utils import artifacts
+from utils import artifacts, document_cache
 from utils.logger import logger, log_error
 
 router = APIRouter()
 
+_BANNER = "=" * 80
+
+# Multi-line banners emitted as a single log call each (args are filled in lazily)
+_REQUEST_BANNER = "\n".join(
+    [_BANNER, "{} request received", "   Resume ID: {}", "   Candidate: {}", "   Template: {}", _BANNER]
+)
+_SUCCESS_BANNER = "\n".join([_BANNER, "{} generated successfully", "   Filename: {}", "   Size: {} KB", _BANNER])
+
+# Built once; validate_json parses the raw body in pydantic-core without a dict round-trip
+_GENERATE_REQUEST_ADAPTER = TypeAdapter(GeneratePDFRequest)
+
+# Request body schema for OpenAPI, since the body is read from the raw request
+_GENERATE_REQUEST_SCHEMA = GeneratePDFRequest.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_GENERATE_REQUEST_SCHEMA.pop("$defs", None)
+_GENERATE_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _GENERATE_REQUEST_SCHEMA}},
+    }
+}
+
+
+# "YYYY-MM-DD" for download filenames, rebuilt only when the day rolls over
+_date_cache = {"day": None, "str": ""}
+
+
+def _today_str() -> str:
+    """Return today's date as YYYY-MM-DD, cached per calendar day"""
+    today = date.today()
+    day = today.toordinal()
+    if _date_cache["day"] != day:
+        _date_cache["str"] = f"{today.year:04d}-{today.month:02d}-{today.day:02d}"
+        _date_cache["day"] = day
+    return _date_cache["str"]
+
+
+def _content_disposition(filename: str) -> str:
+    """Build an attachment header with an ASCII fallback plus RFC 5987 UTF-8 filename"""
+    ascii_name = filename.encode("ascii", "replace").decode("ascii").replace('"', "_")
+    return f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(filename)}"
+
+
+async def parse_generate_request(raw: Request) -> GeneratePDFRequest:
+    """Validate the raw JSON body directly into a GeneratePDFRequest"""
+    body = await raw.body()
+    try:
+        return _GENERATE_REQUEST_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
 
 @router.post(
     "/generate-pdf",
@@ -32,22 +90,32 @@ router = APIRouter()
         },
         500: {"description": "PDF generation failed"},
     },
+    openapi_extra=_GENERATE_REQUEST_OPENAPI,
 )
-async def generate_pdf(request: GeneratePDFRequest):
+async def generate_pdf(request: GeneratePDFRequest = Depends(parse_generate_request)):
     try:
-        logger.info("=" * 80)
-        logger.info(f"📄 PDF generation request received")
-        logger.info(f"   Resume ID: {request.resume.id}")
-        logger.info(f"   Candidate: {request.resume.personalInfo.name}")
-        logger.info(f"   Template: {request.template}")
-        logger.info("=" * 80)
+        logger.info(
+            _REQUEST_BANNER,
+            "📄 PDF generation",
+            request.resume.id,
+            request.resume.personalInfo.name,
+            request.template,
+        )
 
         # Get template-based document generator
         generator = get_template_generator()
 
-        # Generate PDF from HTML template
-        logger.info("🔄 Generating PDF from HTML template using WeasyPrint...")
-        pdf_bytes = generator.generate_pdf(request.resume)
+        # Generate PDF from HTML template, unless this exact resume was just rendered
+        cache_key = document_cache.cache_key(request.resume, request.template, "pdf")
+        pdf_bytes = document_cache.get(cache_key)
+        if pdf_bytes is None:
+            logger.info("🔄 Generating PDF from HTML template using WeasyPrint...")
+            # Rendering is CPU/blocking work; keep it off the event loop
+            pdf_bytes = await asyncio.to_thread(generator.generate_pdf, request.resume)
+            if pdf_bytes:
+                document_cache.put(cache_key, pdf_bytes)
+        else:
+            logger.info("♻️  Serving cached PDF")
 
         # Check if generation succeeded
         if not pdf_bytes:
@@ -58,29 +126,25 @@ async def generate_pdf(request: GeneratePDFRequest):
             )
 
         # Generate filename
-        candidate_name = request.resume.personalInfo.name.replace(" ", "_")
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        candidate_name = request.resume.personalInfo.safe_filename_stem
+        date_str = _today_str()
         filename = f"{candidate_name}_Resume_{date_str}.pdf"
 
-        logger.info("=" * 80)
-        logger.info("✅ PDF generated successfully")
-        logger.info(f"   Filename: {filename}")
-        logger.info(f"   Size: {len(pdf_bytes) / 1024:.2f} KB")
-        logger.info("=" * 80)
+        size = len(pdf_bytes)
+        logger.info(_SUCCESS_BANNER, "✅ PDF", filename, size >> 10)
 
         # Save PDF to the latest artifact session (or create a new one)
-        session_path = artifacts.get_latest_session(request.resume.id)
-        if session_path is None:
-            session_path = artifacts.start_session(request.resume)
-        artifacts.save_pdf(session_path, pdf_bytes, filename)
+        session_path = await asyncio.to_thread(artifacts.ensure_session, request.resume)
+        # Write off the event loop so concurrent requests aren't blocked on disk I/O
+        await asyncio.to_thread(artifacts.save_pdf, session_path, pdf_bytes, filename)
 
         # Return PDF with proper headers
         return Response(
             content=pdf_bytes,
             media_type="application/pdf",
             headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Length": str(len(pdf_bytes)),
+                "Content-Disposition": _content_disposition(filename),
+                "Content-Length": str(size),
             },
         )
 
@@ -117,22 +181,31 @@ async def generate_pdf(request: GeneratePDFRequest):
         },
         500: {"description": "DOCX generation failed"},
     },
+    openapi_extra=_GENERATE_REQUEST_OPENAPI,
 )
-async def generate_docx(request: GeneratePDFRequest):
+async def generate_docx(request: GeneratePDFRequest = Depends(parse_generate_request)):
     try:
-        logger.info("=" * 80)
-        logger.info(f"📝 DOCX generation request received")
-        logger.info(f"   Resume ID: {request.resume.id}")
-        logger.info(f"   Candidate: {request.resume.personalInfo.name}")
-        logger.info(f"   Template: {request.template}")
-        logger.info("=" * 80)
+        logger.info(
+            _REQUEST_BANNER,
+            "📝 DOCX generation",
+            request.resume.id,
+            request.resume.personalInfo.name,
+            request.template,
+        )
 
         # Get template-based document generator
         generator = get_template_generator()
 
-        # Generate DOCX
-        logger.info("🔄 Generating DOCX from template...")
-        docx_bytes = generator.generate_docx(request.resume)
+        # Generate DOCX, unless this exact resume was just rendered
+        cache_key = document_cache.cache_key(request.resume, request.template, "docx")
+        docx_bytes = document_cache.get(cache_key)
+        if docx_bytes is None:
+            logger.info("🔄 Generating DOCX from template...")
+            docx_bytes = await asyncio.to_thread(generator.generate_docx, request.resume)
+            if docx_bytes:
+                document_cache.put(cache_key, docx_bytes)
+        else:
+            logger.info("♻️  Serving cached DOCX")
 
         # Check if generation succeeded
         if not docx_bytes:
@@ -143,33 +216,28 @@ async def generate_docx(request: GeneratePDFRequest):
             )
 
         # Generate filename
-        candidate_name = request.resume.personalInfo.name.replace(" ", "_")
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        candidate_name = request.resume.personalInfo.safe_filename_stem
+        date_str = _today_str()
         filename = f"{candidate_name}_Resume_{date_str}.docx"
 
-        logger.info("=" * 80)
-        logger.info("✅ DOCX generated successfully")
-        logger.info(f"   Filename: {filename}")
-        logger.info(f"   Size: {len(docx_bytes) / 1024:.2f} KB")
-        logger.info("=" * 80)
+        size = len(docx_bytes)
+        logger.info(_SUCCESS_BANNER, "✅ DOCX", filename, size >> 10)
 
         # Save DOCX to the latest artifact session (or create a new one)
-        session_path = artifacts.get_latest_session(request.resume.id)
-        if session_path is None:
-            session_path = artifacts.start_session(request.resume)
+        session_path = await asyncio.to_thread(artifacts.ensure_session, request.resume)
 
         # Save DOCX file
         docx_path = session_path / filename
-        docx_path.write_bytes(docx_bytes)
-        logger.info(f"💾 DOCX saved to: {docx_path}")
+        await asyncio.to_thread(docx_path.write_bytes, docx_bytes)
+        logger.info("💾 DOCX saved to: {}", docx_path)
 
         # Return DOCX with proper headers
         return Response(
             content=docx_bytes,
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Length": str(len(docx_bytes)),
+                "Content-Disposition": _content_disposition(filename),
+                "Content-Length": str(size),
             },
         )
 
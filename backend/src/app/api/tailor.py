@@ -3,16 +3,160 @@ AI Tailoring API endpoint - FULLY IMPLEMENTED
 Optimizes resumes for specific job descriptions using Gemini AI
 """
 
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+import asyncio
+import json
+import time
+from datetime import date
+from typing import Optional, Tuple
 
-from models.resume import TailorRequest, TailorResponse, ErrorResponse
-from services.gemini import get_gemini_service
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+
+from app.config import settings
+from models.resume import TAILOR_REQUEST_ADAPTER, TailorRequest, TailorResponse, ErrorResponse
+from services.gemini import get_gemini_service, gemini_limiter
+from utils.async_writer import artifact_writer
 from utils.logger import logger, log_error
-from utils import artifacts
+from utils.rate_limit import RequestLimiter
+from utils import artifacts, tailor_cache
 
 router = APIRouter()
 
+# Bounds concurrent tailoring work; excess requests get 503 + Retry-After
+_tailor_limiter = RequestLimiter(settings.MAX_CONCURRENT_TAILORS)
+
+# /tailor/status probe result: (monotonic expiry, (status_code, payload))
+_status_cache: Tuple[float, Optional[Tuple[int, dict]]] = (0.0, None)
+
+# Request body schema for OpenAPI, since the body is read from the raw request
+_TAILOR_REQUEST_SCHEMA = TailorRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+_TAILOR_REQUEST_SCHEMA.pop("$defs", None)
+_TAILOR_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _TAILOR_REQUEST_SCHEMA}},
+    }
+}
+
+_BANNER = "=" * 80
+
+# Multi-line banners emitted as a single log call each (args are filled in lazily)
+_REQUEST_BANNER = "\n".join(
+    [
+        _BANNER,
+        "📨 New tailor request received",
+        "   Resume ID: {}",
+        "   Resume Name: {}",
+        "   Candidate: {}",
+        "   Job Description Length: {} chars",
+        "   Target Role: {}",
+        "   Preserve Structure: {}",
+        _BANNER,
+    ]
+)
+_SUCCESS_BANNER = "\n".join(
+    [
+        _BANNER,
+        "✅ Resume tailoring completed successfully",
+        "   ATS Score: {}/100",
+        "   Matched Keywords: {}",
+        "   Missing Keywords: {}",
+        "   Suggestions: {}",
+        "   Changes Made: {}",
+        _BANNER,
+    ]
+)
+
+
+async def _save_tailored_artifact(request: TailorRequest, tailor_response: TailorResponse) -> None:
+    """Queue the tailored resume JSON for a new artifact session, off the event loop"""
+    session_path = await asyncio.to_thread(artifacts.start_session, request.resume, request.targetRole)
+    date_str = date.today().isoformat()
+    candidate_name = request.resume.personalInfo.safe_filename_stem
+    json_path = session_path / f"{candidate_name}_Tailored_{date_str}.json"
+    artifact_writer.enqueue(json_path, tailor_response.model_dump_json(indent=2).encode())
+
+    logger.info(f"🧾 Tailored resume JSON queued for: {json_path}")
+
+
+def _sse(event: str, data: str) -> bytes:
+    """Encode one Server-Sent Events message (data must already be JSON)"""
+    return f"event: {event}\ndata: {data}\n\n".encode()
+
+
+def _probe_tailor_service() -> Tuple[int, dict]:
+    """Check the Gemini service once; returns (status_code, payload)"""
+    try:
+        gemini_service = get_gemini_service()
+        return status.HTTP_200_OK, {
+            "status": "available",
+            "model": gemini_service.model,
+            "message": "AI tailoring service is ready",
+        }
+    except Exception as e:
+        logger.error(f"Tailor service status check failed: {e}")
+        return status.HTTP_503_SERVICE_UNAVAILABLE, {
+            "status": "unavailable",
+            "error": str(e),
+            "message": "AI tailoring service is not properly configured",
+        }
+
+
+def _invalidate_status_cache() -> None:
+    """Force the next /tailor/status call to re-probe (e.g. after a Gemini failure)"""
+    global _status_cache
+    _status_cache = (0.0, None)
+
+
+def _log_tailor_request(request: TailorRequest) -> None:
+    """One DEBUG record describing an incoming tailor request"""
+    logger.debug(
+        _REQUEST_BANNER,
+        request.resume.id,
+        request.resume.name,
+        request.resume.personalInfo.name,
+        len(request.jobDescription),
+        request.targetRole or "Not specified",
+        request.preserveStructure,
+    )
+
+
+def _log_tailor_success(tailor_response: TailorResponse) -> None:
+    """One DEBUG record summarizing a tailoring result; keywords go in structured extras"""
+    logger.bind(
+        matched_keywords=tailor_response.matchedKeywords[:10],
+        missing_keywords=tailor_response.missingKeywords[:10],
+    ).debug(
+        _SUCCESS_BANNER,
+        tailor_response.atsScore,
+        len(tailor_response.matchedKeywords),
+        len(tailor_response.missingKeywords),
+        len(tailor_response.suggestions),
+        len(tailor_response.changes),
+    )
+
+
+async def parse_tailor_request(raw: Request) -> TailorRequest:
+    """Validate the raw JSON body directly into a TailorRequest"""
+    body = await raw.body()
+    try:
+        return TAILOR_REQUEST_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
+
+def _error_context(request: TailorRequest) -> dict:
+    """Small log context for failures; avoids dumping the whole resume tree"""
+    return {
+        "resume_id": request.resume.id,
+        "job_description_length": len(request.jobDescription),
+        "target_role": request.targetRole,
+    }
+
 
 @router.post(
     "/tailor",
@@ -26,8 +170,9 @@ router = APIRouter()
         500: {"model": ErrorResponse, "description": "AI service error"},
         503: {"model": ErrorResponse, "description": "Service temporarily unavailable"},
     },
+    openapi_extra=_TAILOR_REQUEST_OPENAPI,
 )
-async def tailor_resume(request: TailorRequest):
+async def tailor_resume(request: TailorRequest = Depends(parse_tailor_request)):
     """
     Tailor resume to match job description using Gemini AI
     
@@ -58,103 +203,171 @@ async def tailor_resume(request: TailorRequest):
     - suggestions: Actionable improvement suggestions
     - changes: Summary of modifications made
     """
-    try:
-        logger.info("=" * 80)
-        logger.info(f"📨 New tailor request received")
-        logger.info(f"   Resume ID: {request.resume.id}")
-        logger.info(f"   Resume Name: {request.resume.name}")
-        logger.info(f"   Candidate: {request.resume.personalInfo.name}")
-        logger.info(f"   Job Description Length: {len(request.jobDescription)} chars")
-        logger.info(f"   Target Role: {request.targetRole or 'Not specified'}")
-        logger.info(f"   Preserve Structure: {request.preserveStructure}")
-        logger.info("=" * 80)
-
-        # Log resume details for debugging
-        logger.debug(f"Resume has {len(request.resume.experience)} work experiences")
-        logger.debug(f"Resume has {len(request.resume.projects)} projects")
-        logger.debug(f"Resume has {len(request.resume.skills)} skills")
-
-        # Get Gemini service
+    async with _tailor_limiter:
         try:
-            gemini_service = get_gemini_service()
-        except Exception as e:
-            logger.error(f"Failed to initialize Gemini service: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="AI service is not properly configured. Please check GEMINI_API_KEY.",
-            )
+            _log_tailor_request(request)
 
-        # Tailor resume
-        logger.info("🤖 Sending request to Gemini AI...")
-        tailor_response = gemini_service.tailor_resume(
-            resume=request.resume,
-            job_description=request.jobDescription,
-        )
+            # Log resume details for debugging
+            logger.debug(f"Resume has {len(request.resume.experience)} work experiences")
+            logger.debug(f"Resume has {len(request.resume.projects)} projects")
+            logger.debug(f"Resume has {len(request.resume.skills)} skills")
+
+            # Identical resume + job description submitted recently: skip Gemini
+            cache_key = tailor_cache.cache_key(request)
+            cached_response = tailor_cache.get(cache_key, request)
+            if cached_response is not None:
+                logger.info("♻️ Returning cached tailoring result")
+                return cached_response
+
+            # Get Gemini service
+            try:
+                gemini_service = get_gemini_service()
+            except Exception as e:
+                logger.error(f"Failed to initialize Gemini service: {e}")
+                _invalidate_status_cache()
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="AI service is not properly configured. Please check GEMINI_API_KEY.",
+                )
+
+            # Tailor resume
+            logger.info("🤖 Sending request to Gemini AI...")
+            if settings.GEMINI_PARALLEL_SECTIONS:
+                tailor_response = await gemini_service.atailor_resume_by_section(
+                    resume=request.resume,
+                    job_description=request.jobDescription,
+                )
+            else:
+                tailor_response = await gemini_service.atailor_resume(
+                    resume=request.resume,
+                    job_description=request.jobDescription,
+                )
 
-        # Check if tailoring succeeded
-        if not tailor_response:
-            logger.error("❌ Gemini AI failed to tailor resume")
+            # Check if tailoring succeeded
+            if not tailor_response:
+                logger.error("❌ Gemini AI failed to tailor resume")
+                _invalidate_status_cache()
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Gemini API is currently preserving energy (Rate Limit/Overloaded). Please try again in a moment.",
+                )
+
+            tailor_cache.put(cache_key, tailor_response)
+
+            # Log success
+            _log_tailor_success(tailor_response)
+
+            # Save tailored JSON artifact to a unique session folder
+            await _save_tailored_artifact(request, tailor_response)
+
+            return tailor_response
+
+        except HTTPException:
+            # Re-raise HTTP exceptions
+            raise
+
+        except ValueError as e:
+            # Validation errors
+            logger.error(f"Validation error: {e}")
+            log_error(e, _error_context(request))
             raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Gemini API is currently preserving energy (Rate Limit/Overloaded). Please try again in a moment.",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid request: {str(e)}",
             )
 
-        # Log success
-        logger.info("=" * 80)
-        logger.info("✅ Resume tailoring completed successfully")
-        logger.info(f"   ATS Score: {tailor_response.atsScore}/100")
-        logger.info(f"   Matched Keywords: {len(tailor_response.matchedKeywords)}")
-        logger.info(f"   Missing Keywords: {len(tailor_response.missingKeywords)}")
-        logger.info(f"   Suggestions: {len(tailor_response.suggestions)}")
-        logger.info(f"   Changes Made: {len(tailor_response.changes)}")
-        logger.info("=" * 80)
-
-        # Log matched and missing keywords
-        logger.info(f"Matched keywords: {', '.join(tailor_response.matchedKeywords[:10])}...")
-        if tailor_response.missingKeywords:
-            logger.info(
-                f"Missing keywords: {', '.join(tailor_response.missingKeywords[:10])}..."
+        except Exception as e:
+            # Unexpected errors
+            logger.error(f"Unexpected error in tailor endpoint: {e}")
+            log_error(e, _error_context(request))
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred while processing your request. Please try again later.",
             )
 
-        # Save tailored JSON artifact to a unique session folder
-        session_path = artifacts.start_session(request.resume, request.targetRole)
-        date_str = __import__("datetime").datetime.now().strftime("%Y-%m-%d")
-        candidate_name = request.resume.personalInfo.name.replace(" ", "_")
-        json_filename = f"{candidate_name}_Tailored_{date_str}.json"
-        artifacts.save_json(session_path, tailor_response.model_dump_json(indent=2), json_filename)
 
-        logger.info(f"🧾 Tailored resume JSON saved to: {session_path / json_filename}")
+@router.post(
+    "/tailor/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Tailor Resume (streaming)",
+    description="Same as /tailor, but streams progress as Server-Sent Events while Gemini generates",
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        503: {"model": ErrorResponse, "description": "AI service unavailable"},
+    },
+    openapi_extra=_TAILOR_REQUEST_OPENAPI,
+)
+async def tailor_resume_stream(request: TailorRequest = Depends(parse_tailor_request)):
+    """
+    Stream tailoring progress as Server-Sent Events
 
-        return tailor_response
+    Events:
+    - progress: {"chars": n} characters received from Gemini so far
+    - keywords: {"matchedKeywords": [...]} as soon as they are available
+    - result: the full TailorResponse (same shape as /tailor)
+    - error: {"message": "..."} if tailoring failed
+    """
+    _log_tailor_request(request)
 
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
+    # Reject up front while saturated; the slot itself is held by the stream below
+    _tailor_limiter.ensure_capacity()
 
-    except ValueError as e:
-        # Validation errors
-        logger.error(f"Validation error: {e}")
-        log_error(e, {"request": request.model_dump()})
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid request: {str(e)}",
-        )
+    cache_key = tailor_cache.cache_key(request)
+    cached_response = tailor_cache.get(cache_key, request)
 
+    # Fail before the stream starts so clients still get a proper 503
+    try:
+        gemini_service = get_gemini_service()
     except Exception as e:
-        # Unexpected errors
-        logger.error(f"Unexpected error in tailor endpoint: {e}")
-        log_error(
-            e,
-            {
-                "resume_id": request.resume.id,
-                "job_description_length": len(request.jobDescription),
-            },
-        )
+        logger.error(f"Failed to initialize Gemini service: {e}")
+        _invalidate_status_cache()
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while processing your request. Please try again later.",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI service is not properly configured. Please check GEMINI_API_KEY.",
         )
 
+    async def events():
+        if cached_response is not None:
+            logger.info("♻️ Returning cached tailoring result")
+            yield _sse("result", cached_response.model_dump_json())
+            return
+
+        try:
+            _tailor_limiter.acquire()
+        except HTTPException as e:
+            yield _sse("error", json.dumps({"message": e.detail}))
+            return
+
+        try:
+            async for event in gemini_service.atailor_resume_stream(
+                resume=request.resume,
+                job_description=request.jobDescription,
+            ):
+                if event["event"] == "error":
+                    _invalidate_status_cache()
+                if event["event"] != "result":
+                    yield _sse(event["event"], json.dumps(event["data"]))
+                    continue
+
+                tailor_response = event["data"]
+                tailor_cache.put(cache_key, tailor_response)
+                _log_tailor_success(tailor_response)
+                await _save_tailored_artifact(request, tailor_response)
+                yield _sse("result", tailor_response.model_dump_json())
+
+        except Exception as e:
+            logger.error(f"Unexpected error in tailor stream endpoint: {e}")
+            log_error(e, _error_context(request))
+            yield _sse("error", json.dumps({"message": "An unexpected error occurred while processing your request."}))
+
+        finally:
+            _tailor_limiter.release()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 @router.get(
     "/tailor/status",
@@ -166,22 +379,20 @@ async def tailor_status():
     """
     Check if the AI tailoring service is properly configured and available
     """
-    try:
-        gemini_service = get_gemini_service()
-        return JSONResponse(
-            content={
-                "status": "available",
-                "model": gemini_service.model,
-                "message": "AI tailoring service is ready",
-            }
-        )
-    except Exception as e:
-        logger.error(f"Tailor service status check failed: {e}")
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "status": "unavailable",
-                "error": str(e),
-                "message": "AI tailoring service is not properly configured",
-            },
-        )
+    global _status_cache
+    now = time.monotonic()
+    expiry, cached = _status_cache
+    if cached is None or now >= expiry:
+        cached = _probe_tailor_service()
+        _status_cache = (now + settings.GEMINI_STATUS_TTL, cached)
+
+    status_code, content = cached
+    if status_code == status.HTTP_200_OK:
+        # Load figures are live; only the service probe is cached
+        content = {
+            **content,
+            "limiter": gemini_limiter.snapshot(),
+            "in_flight_tailors": _tailor_limiter.in_flight,
+            "max_concurrent_tailors": _tailor_limiter.max_in_flight,
+        }
+    return JSONResponse(status_code=status_code, content=content)
@@ -3,8 +3,9 @@ Configuration management using Pydantic Settings
 Loads environment variables and provides typed configuration
 """
 
+from functools import cached_property
 from pydantic_settings import BaseSettings
-from typing import List, Union
+from typing import List, Tuple, Union
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -14,13 +15,16 @@ current_file = Path(__file__).resolve()
 backend_dir = current_file.parent.parent.parent
 env_path = backend_dir / '.env'
 
-print(f"Looking for .env at: {env_path}")
+# Messages recorded before logging is configured; utils.logger emits them once it is set up
+startup_messages: List[Tuple[str, str]] = []
+
+startup_messages.append(("DEBUG", f"Looking for .env at: {env_path}"))
 
 if env_path.exists():
     load_dotenv(dotenv_path=env_path)
-    print(f"Loaded .env from: {env_path}")
+    startup_messages.append(("DEBUG", f"Loaded .env from: {env_path}"))
 else:
-    print(f"WARNING: .env file not found at: {env_path}")
+    startup_messages.append(("WARNING", f".env file not found at: {env_path}"))
 
 
 class Settings(BaseSettings):
@@ -39,12 +43,30 @@ class Settings(BaseSettings):
 
     # Gemini AI Configuration (NEW google-genai package)
     GEMINI_API_KEY: str = ""
+    GEMINI_API_KEYS: str = ""  # optional extra keys (comma-separated), rotated with GEMINI_API_KEY
+    GEMINI_KEY_COOLDOWN: int = 60  # seconds a key sits out after a 429
     GEMINI_MODEL: str = ""
     GEMINI_TEMPERATURE: float = 0.7
     GEMINI_MAX_TOKENS: int = 16384
     GEMINI_TIMEOUT: int = 30
     GEMINI_RETRY_ATTEMPTS: int = 3
     GEMINI_RETRY_DELAY: float = 1.0
+    GEMINI_CONCURRENCY: int = 4  # max in-flight Gemini calls per worker
+    GEMINI_RPM: int = 60  # client-side requests-per-minute cap (0 disables)
+    GEMINI_PARALLEL_SECTIONS: bool = False  # tailor each resume section in its own concurrent call
+    GEMINI_STATUS_TTL: int = 30  # seconds to reuse the /tailor/status probe result
+    MAX_CONCURRENT_TAILORS: int = 8  # /tailor requests admitted at once; extra ones get 503
+
+    # Tailoring response cache (repeat resume + job description submissions)
+    TAILOR_CACHE_SIZE: int = 256
+    TAILOR_CACHE_TTL: int = 3600
+    # Raw replies to keyword-extraction/section prompts (shares TAILOR_CACHE_TTL)
+    PROMPT_CACHE_SIZE: int = 512
+
+    # Rendered PDF/DOCX cache (identical re-downloads skip rendering)
+    DOCUMENT_CACHE_SIZE: int = 64
+    # Resumes with less body text than this (chars) skip PDF stream compression
+    PDF_COMPRESS_THRESHOLD: int = 50_000
 
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
@@ -64,11 +86,22 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = True
 
-    def get_cors_origins(self) -> List[str]:
-        """Convert CORS_ORIGINS to list if it's a string"""
+    @cached_property
+    def cors_origins_list(self) -> List[str]:
+        """CORS_ORIGINS as a list, parsed once"""
         if isinstance(self.CORS_ORIGINS, str):
             return [origin.strip() for origin in self.CORS_ORIGINS.split(',')]
-        return self.CORS_ORIGINS
+        return list(self.CORS_ORIGINS)
+
+    @property
+    def gemini_api_keys(self) -> List[str]:
+        """GEMINI_API_KEY followed by any distinct GEMINI_API_KEYS entries"""
+        keys = [self.GEMINI_API_KEY] if self.GEMINI_API_KEY else []
+        for key in self.GEMINI_API_KEYS.split(","):
+            key = key.strip()
+            if key and key not in keys:
+                keys.append(key)
+        return keys
 
 
 # Create global settings instance
@@ -76,8 +109,10 @@ settings = Settings()
 
 # Check for critical configuration
 if not settings.GEMINI_API_KEY:
-    print("WARNING: GEMINI_API_KEY not set in .env file. AI features will not work.")
+    startup_messages.append(("WARNING", "GEMINI_API_KEY not set in .env file. AI features will not work."))
 
-print(f"Loaded configuration from: {env_path if env_path.exists() else 'Environment Variables'}")
-print(f"Environment: {settings.ENVIRONMENT}")
-print(f"CORS Origins: {settings.get_cors_origins()}")
+startup_messages.append(
+    ("DEBUG", f"Loaded configuration from: {env_path if env_path.exists() else 'Environment Variables'}")
+)
+startup_messages.append(("DEBUG", f"Environment: {settings.ENVIRONMENT}"))
+startup_messages.append(("DEBUG", f"CORS Origins: {settings.cors_origins_list}"))
@@ -5,12 +5,16 @@ Main application entry point with API routes, middleware, and logging
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import time
+from fastapi.responses import JSONResponse, ORJSONResponse
+import asyncio
+import httpx
 import uvicorn
 
 from app.api import health, tailor, pdf
 from app.config import settings
+from services.gemini import get_gemini_service
+from utils.async_writer import artifact_writer
+from utils.json_codec import ORJSON_AVAILABLE
 from utils.logger import logger, log_request
 
 # Initialize FastAPI app
@@ -20,12 +24,14 @@ app = FastAPI(
     version="2.0.0",  # Align with tests expecting 2.0.0
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson renders response bodies several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
 )
 
 # Configure CORS for Chrome Extension (Module 1 fix)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.get_cors_origins(),  # Using helper method
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -36,21 +42,23 @@ app.add_middleware(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all HTTP requests with timing"""
-    start_time = time.time()
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    path = request.url.path
 
     # Log incoming request
-    logger.info(f"➡️  Incoming: {request.method} {request.url.path}")
+    logger.info("➡️  Incoming: {} {}", request.method, path)
 
     # Process request
     response = await call_next(request)
 
     # Calculate duration
-    duration_ms = (time.time() - start_time) * 1000
+    duration_ms = (loop.time() - start_time) * 1000
 
     # Log response
     log_request(
         method=request.method,
-        path=request.url.path,
+        path=path,
         status_code=response.status_code,
         duration_ms=duration_ms,
     )
@@ -63,7 +71,21 @@ async def log_requests(request: Request, call_next):
 
 @app.on_event("startup")
 async def startup_event():
-    """Log startup information"""
+    """Log startup information and create shared clients"""
+    # Shared HTTP client so dependency probes reuse pooled keep-alive connections
+    app.state.http_client = httpx.AsyncClient(
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+    # Build the Gemini client up front so the first request/health probe doesn't pay for it
+    app.state.gemini = None
+    if settings.GEMINI_API_KEY:
+        try:
+            app.state.gemini = get_gemini_service()
+        except Exception as e:
+            logger.error(f"Failed to initialize Gemini service: {str(e)}")
+
     logger.info("=" * 80)
     logger.info("🚀 Resume Tailor API (Module 3) starting up...")
     logger.info(f"📝 Environment: {settings.ENVIRONMENT}")
@@ -76,11 +98,18 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Log shutdown information"""
+    """Log shutdown information and close shared clients"""
     logger.info("=" * 80)
     logger.info("🛑 Resume Tailor API shutting down...")
     logger.info("=" * 80)
 
+    http_client = getattr(app.state, "http_client", None)
+    if http_client is not None:
+        await http_client.aclose()
+
+    # Make sure queued artifact writes reach disk before the worker exits
+    await asyncio.to_thread(artifact_writer.flush)
+
 
 # Include API routers
 app.include_router(health.router, prefix="/api", tags=["Health"])
@@ -135,4 +164,6 @@ if __name__ == "__main__":
         port=8000,
         reload=settings.ENVIRONMENT == "development",
         log_level="info",
+        timeout_keep_alive=30,
+        server_header=False,
     )
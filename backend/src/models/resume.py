@@ -7,16 +7,58 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
-from typing import List, Optional, Union, Dict
-
-from pydantic import AliasChoices, BaseModel, Field, field_validator
+from typing import Annotated, List, Optional, Union, Dict
+
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
+)
+from typing_extensions import TypedDict
+
+# Shared string constraints, reused so each compiles to one schema shape
+ShortName = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+MediumText = Annotated[str, StringConstraints(min_length=1, max_length=1000)]
+
+# Bullet points, achievements and highlights
+BULLET_MAX_LENGTH = 1000
+BulletStr = Annotated[str, StringConstraints(strip_whitespace=True, max_length=BULLET_MAX_LENGTH)]
+
+__all__ = [
+    "PersonalInfo",
+    "Education",
+    "Experience",
+    "Project",
+    "Certification",
+    "Resume",
+    "TailorRequest",
+    "KeywordMatch",
+    "TailorResponse",
+    "GeneratePDFRequest",
+    "ServiceStatus",
+    "HealthResponse",
+    "ErrorResponse",
+    "RESUME_ADAPTER",
+    "TAILOR_REQUEST_ADAPTER",
+]
+
+# Separators accepted in free-text skill lists
+_SKILL_SPLIT = re.compile(r"[,;\n]")
+
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+
+# Checked by pydantic-core's own regex engine and kept as "pattern" in the OpenAPI schema
+Email = Annotated[str, StringConstraints(pattern=EMAIL_PATTERN)]
 
 
 class PersonalInfo(BaseModel):
     """Personal information section"""
 
     name: str = Field(..., min_length=1, max_length=100)
-    email: str = Field(..., pattern=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    email: Email
     phone: Optional[str] = Field(None, max_length=20)
     location: Optional[str] = Field(None, max_length=100)
     linkedin: Optional[str] = None
@@ -30,19 +72,24 @@ class PersonalInfo(BaseModel):
 
     summary: Optional[str] = Field(None, max_length=2000)  # Increased for AI-enhanced summaries
 
+    @property
+    def safe_filename_stem(self) -> str:
+        """Candidate name with spaces replaced by underscores, for artifact filenames"""
+        return self.name.replace(" ", "_")
+
 
 class Education(BaseModel):
     """Education entry"""
 
-    institution: str = Field(..., min_length=1, max_length=200)
-    degree: str = Field(..., min_length=1, max_length=200)
+    institution: ShortName
+    degree: ShortName
     field: Optional[str] = Field(None, max_length=200)
     startDate: str  # Format: "YYYY-MM" or "YYYY"
     endDate: str  # Format: "YYYY-MM" or "YYYY" or "Present"
     gpa: Optional[str] = None
 
     # Accept legacy "coursework" from older exports.
-    achievements: List[str] = Field(
+    achievements: List[BulletStr] = Field(
         default_factory=list,
         validation_alias=AliasChoices("achievements", "coursework"),
     )
@@ -61,32 +108,22 @@ class Experience(BaseModel):
     """Work experience entry"""
 
     # Accept legacy keys from older exports.
-    company: str = Field(
-        ...,
-        min_length=1,
-        max_length=200,
-        validation_alias=AliasChoices("company", "employer"),
-    )
-    position: str = Field(
-        ...,
-        min_length=1,
-        max_length=200,
-        validation_alias=AliasChoices("position", "role"),
-    )
+    company: ShortName = Field(validation_alias=AliasChoices("company", "employer"))
+    position: ShortName = Field(validation_alias=AliasChoices("position", "role"))
 
     location: Optional[str] = Field(None, max_length=100)
     startDate: str  # Format: "YYYY-MM" or "YYYY"
     endDate: str  # Format: "YYYY-MM" or "YYYY" or "Present"
-    description: List[str] = Field(..., min_items=1)
+    description: List[BulletStr] = Field(..., min_length=1)
 
 
 class Project(BaseModel):
     """Project entry"""
 
-    name: str = Field(..., min_length=1, max_length=200)
+    name: ShortName
 
     # Older exports sometimes sent a list of strings; coerce to a single string.
-    description: str = Field(..., min_length=1, max_length=1000)  # Increased for AI enhancements
+    description: MediumText  # Increased for AI enhancements
 
     technologies: List[str] = Field(default_factory=list)
 
@@ -96,7 +133,7 @@ class Project(BaseModel):
         validation_alias=AliasChoices("link", "github"),
     )
 
-    highlights: List[str] = Field(default_factory=list)
+    highlights: List[BulletStr] = Field(default_factory=list)
     startDate: Optional[str] = None
     endDate: Optional[str] = None
 
@@ -115,8 +152,8 @@ class Project(BaseModel):
 class Certification(BaseModel):
     """Certification entry"""
 
-    name: str = Field(..., min_length=1, max_length=200)
-    issuer: str = Field(..., min_length=1, max_length=200)
+    name: ShortName
+    issuer: ShortName
     date: str  # Format: "YYYY-MM" or "YYYY"
     credentialId: Optional[str] = None
     url: Optional[str] = None
@@ -129,10 +166,10 @@ class Resume(BaseModel):
     name: str = Field(..., min_length=1, max_length=100, description="Resume version name")
     personalInfo: PersonalInfo
     education: List[Education] = Field(default_factory=list)
-    experience: List[Experience] = Field(default_factory=list)
+    experience: List[Experience] = Field(default_factory=list, min_length=1)
 
     # Allow skills to be a list or a dictionary of categories
-    skills: Union[Dict[str, List[str]], List[str]] = Field(default_factory=list)
+    skills: Union[Dict[str, List[str]], List[str]] = Field(default_factory=list, min_length=1)
 
     projects: List[Project] = Field(default_factory=list)
     certifications: List[Certification] = Field(default_factory=list)
@@ -160,7 +197,7 @@ class Resume(BaseModel):
                 if isinstance(val, list):
                     cleaned[k] = [str(s).strip() for s in val if str(s).strip()]
                 elif isinstance(val, str):
-                    cleaned[k] = [s.strip() for s in re.split(r"[,;\n]", val) if s.strip()]
+                    cleaned[k] = [s.strip() for s in _SKILL_SPLIT.split(val) if s.strip()]
             return cleaned
 
         # legacy: list of objects [{category, skills:"a,b"}]
@@ -175,7 +212,7 @@ class Resume(BaseModel):
                     if isinstance(raw, list):
                         new_skills[cat] = raw
                     else:
-                        new_skills[cat] = [s.strip() for s in re.split(r"[,;\n]", str(raw)) if s.strip()]
+                        new_skills[cat] = [s.strip() for s in _SKILL_SPLIT.split(str(raw)) if s.strip()]
                 return new_skills
 
             # Otherwise treat as flat list
@@ -186,25 +223,32 @@ class Resume(BaseModel):
             return out
 
         if isinstance(v, str):
-            return [s.strip() for s in re.split(r"[,;\n]", v) if s.strip()]
+            return [s.strip() for s in _SKILL_SPLIT.split(v) if s.strip()]
 
         return v
 
-    @field_validator("skills")
     @classmethod
-    def validate_skills(cls, v):
-        """Ensure skills list/dict is not empty"""
-        if not v:
-            raise ValueError("At least one skill is required")
-        return v
-
-    @field_validator("experience")
-    @classmethod
-    def validate_experience(cls, v):
-        """Ensure at least one experience entry"""
-        if not v:
-            raise ValueError("At least one work experience is required")
-        return v
+    def from_trusted(cls, data: dict) -> "Resume":
+        """
+        Build a Resume without validation.
+
+        Only for data this backend already validated (e.g. saved artifacts);
+        never use on client input.
+        """
+        values = dict(data)
+        values["personalInfo"] = PersonalInfo.model_construct(**values["personalInfo"])
+        for key, model in (
+            ("education", Education),
+            ("experience", Experience),
+            ("projects", Project),
+            ("certifications", Certification),
+        ):
+            if values.get(key):
+                values[key] = [model.model_construct(**item) for item in values[key]]
+        for key in ("createdAt", "updatedAt"):
+            if isinstance(values.get(key), str):
+                values[key] = datetime.fromisoformat(values[key])
+        return cls.model_construct(**values)
 
 
 class TailorRequest(BaseModel):
@@ -220,6 +264,11 @@ class TailorRequest(BaseModel):
     )
 
 
+# Built once; validate_json parses raw bytes in pydantic-core without a dict round-trip
+RESUME_ADAPTER = TypeAdapter(Resume)
+TAILOR_REQUEST_ADAPTER = TypeAdapter(TailorRequest)
+
+
 class KeywordMatch(BaseModel):
     """Keyword matching information"""
 
@@ -246,13 +295,23 @@ class GeneratePDFRequest(BaseModel):
     template: str = Field(default="default", description="PDF template to use")
 
 
+class ServiceStatus(TypedDict, total=False):
+    """Status of one dependency in the health check (only the keys a probe reports)"""
+
+    status: str
+    error: str
+    response_time_ms: float
+    model: str
+    key_length: int
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
 
     status: str
     version: str
-    timestamp: datetime
-    services: dict = Field(default_factory=dict)
+    timestamp: int  # Unix epoch seconds
+    services: Dict[str, ServiceStatus] = Field(default_factory=dict)
 
 
 class ErrorResponse(BaseModel):
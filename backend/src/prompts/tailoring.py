@@ -3,6 +3,20 @@ Prompt templates for Gemini AI resume tailoring
 Separated for easy modification without touching code
 """
 import json
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def compact_json(data) -> str:
+    """Serialize prompt data as compact JSON (fewer tokens than pretty-printed)"""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
 
 # System instruction for Gemini
 SYSTEM_INSTRUCTION = """You are an expert ATS (Applicant Tracking System) resume optimizer and career coach.
@@ -22,37 +36,26 @@ CRITICAL RULES:
 OUTPUT FORMAT:
 You must return a valid JSON object matching this exact structure:
 {
-  "tailoredResume": { <complete resume object with enhanced content> },
   "matchedKeywords": ["keyword1", "keyword2", ...],
   "missingKeywords": ["keyword3", "keyword4", ...],
+  "tailoredResume": { <complete resume object with enhanced content> },
   "suggestions": ["suggestion1", "suggestion2", ...],
   "changes": ["change1", "change2", ...]
 }
 """
 
 
-def get_tailoring_prompt(minimal_resume: dict, job_description: str, candidate_name: str) -> str:
-    """
-    Generate the main tailoring prompt using minimal resume data
-    
-    Args:
-        minimal_resume: Dict with only summary, experiences, projects, skills
-        job_description: The job description text
-        candidate_name: Candidate's name for logging
-        
-    Returns:
-        Complete prompt for Gemini
-    """
-    return f"""
+# Main tailoring prompt, filled with str.format_map (literal braces are doubled)
+_TAILORING_TEMPLATE = """
         TASK: Tailor this resume content for the job description below.
 
-        CANDIDATE: {candidate_name}
+        CANDIDATE: {name}
 
         JOB DESCRIPTION:
-        {job_description}
+        {jd}
 
         RESUME CONTENT TO ENHANCE:
-        {json.dumps(minimal_resume, indent=2)}
+        {resume}
 
         INSTRUCTIONS:
         1. **Summary** (MAX 120 words):
@@ -96,27 +99,29 @@ def get_tailoring_prompt(minimal_resume: dict, job_description: str, candidate_n
         - Return content in SAME ORDER as input
         - Match companies/projects by their names exactly
 
-        OUTPUT FORMAT (JSON ONLY):
+        OUTPUT FORMAT (JSON ONLY, keys in this order):
         {{
-        "summary": "Enhanced summary text",
-        "experiences": [
-            {{
-            "company": "Company Name",
-            "description": ["Enhanced bullet 1", "Enhanced bullet 2", ...]
-            }}
-        ],
-        "projects": [
-            {{
-            "name": "Project Name",
-            "highlights": ["Enhanced highlight 1", "Enhanced highlight 2", ...]
-            }}
-        ],
-        "skills": {{
-            "Category Name": ["skill1", "skill2", ...],
-            ...
-        }},
         "matchedKeywords": ["keyword1", "keyword2", ...],
         "missingKeywords": ["keyword3", "keyword4", ...],
+        "tailoredResume": {{
+            "summary": "Enhanced summary text",
+            "experiences": [
+                {{
+                "company": "Company Name",
+                "description": ["Enhanced bullet 1", "Enhanced bullet 2", ...]
+                }}
+            ],
+            "projects": [
+                {{
+                "name": "Project Name",
+                "highlights": ["Enhanced highlight 1", "Enhanced highlight 2", ...]
+                }}
+            ],
+            "skills": {{
+                "Category Name": ["skill1", "skill2", ...],
+                ...
+            }}
+        }},
         "suggestions": ["suggestion1", "suggestion2", ...],
         "changes": ["change1", "change2", ...]
         }}
@@ -125,6 +130,121 @@ def get_tailoring_prompt(minimal_resume: dict, job_description: str, candidate_n
         """
 
 
+def build_tailoring_prompt(minimal_json: str, job_description: str, candidate_name: str) -> str:
+    """
+    Fill the tailoring template with an already serialized minimal resume,
+    so callers can serialize once and reuse the JSON across attempts
+
+    Args:
+        minimal_json: compact_json() output of the minimal resume
+        job_description: The job description text
+        candidate_name: Candidate's name for logging
+
+    Returns:
+        Complete prompt for Gemini
+    """
+    return _TAILORING_TEMPLATE.format_map(
+        {"name": candidate_name, "jd": job_description, "resume": minimal_json}
+    )
+
+
+def get_tailoring_prompt(minimal_resume: dict, job_description: str, candidate_name: str) -> str:
+    """
+    Generate the main tailoring prompt using minimal resume data
+    
+    Args:
+        minimal_resume: Dict with only summary, experiences, projects, skills
+        job_description: The job description text
+        candidate_name: Candidate's name for logging
+        
+    Returns:
+        Complete prompt for Gemini
+    """
+    return build_tailoring_prompt(compact_json(minimal_resume), job_description, candidate_name)
+
+
+# Per-section instructions and output shapes for parallel section tailoring
+_SECTION_INSTRUCTIONS = {
+    "summary": """
+        - Rewrite the summary (MAX 120 words) to align with the target role
+        - Incorporate key skills and requirements from the JD, including soft skills
+        - Keep it impactful and concise""",
+    "experiences": """
+        - For each company, enhance bullet points to include relevant keywords from the JD
+        - Emphasize achievements matching job requirements
+        - CRITICAL: Each bullet point MUST be between 16-30 words
+        - Incorporate 70-80% of missing tech skills from the JD that relate to existing technologies
+        - Return companies in SAME ORDER as input and match them by name exactly""",
+    "projects": """
+        - For each project, enhance highlights to match technical requirements
+        - Include relevant technologies from the JD
+        - CRITICAL: Each highlight MUST be between 16-30 words
+        - Return projects in SAME ORDER as input and match them by name exactly""",
+    "skills": """
+        - Reorder EXISTING skills by relevance to the JD (most relevant first)
+        - ADD skills mentioned in the JD that are related to existing skills
+        - Add soft skills mentioned in the JD to an appropriate category
+        - Keep the categorized format""",
+}
+
+_SECTION_OUTPUT_FORMATS = {
+    "summary": '{"summary": "Enhanced summary text", "changes": ["change1", ...]}',
+    "experiences": (
+        '{"experiences": [{"company": "Company Name", "description": ["Enhanced bullet 1", ...]}], '
+        '"changes": ["change1", ...]}'
+    ),
+    "projects": (
+        '{"projects": [{"name": "Project Name", "highlights": ["Enhanced highlight 1", ...]}], '
+        '"changes": ["change1", ...]}'
+    ),
+    "skills": (
+        '{"skills": {"Category Name": ["skill1", ...]}, '
+        '"changes": ["change1", ...], "suggestions": ["suggestion1", ...]}'
+    ),
+}
+
+SECTION_NAMES = tuple(_SECTION_INSTRUCTIONS)
+
+
+def get_section_prompt(section: str, section_data, job_description: str, keywords: list) -> str:
+    """
+    Generate a prompt that tailors a single resume section
+
+    Args:
+        section: One of SECTION_NAMES
+        section_data: That section's content from the minimal resume
+        job_description: The job description text
+        keywords: Keywords already extracted from the job description
+
+    Returns:
+        Prompt for Gemini
+    """
+    return f"""
+        TASK: Tailor the {section.upper()} section of a resume for the job description below.
+
+        JOB DESCRIPTION:
+        {job_description}
+
+        KEY JOB KEYWORDS:
+        {", ".join(keywords) if keywords else "(not available)"}
+
+        SECTION CONTENT TO ENHANCE:
+        {compact_json(section_data)}
+
+        INSTRUCTIONS:{_SECTION_INSTRUCTIONS[section]}
+
+        CRITICAL RULES:
+        - Only enhance existing content, don't fabricate
+        - Only return this section; do not invent other sections
+
+        OUTPUT FORMAT (JSON ONLY):
+        {_SECTION_OUTPUT_FORMATS[section]}
+
+        Return ONLY the JSON object. No markdown, no explanations.
+        """
+
+
+@lru_cache(maxsize=128)
 def get_keyword_extraction_prompt(job_description: str) -> str:
     """
     Generate prompt for extracting keywords from job description
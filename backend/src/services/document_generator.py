@@ -13,32 +13,79 @@ Features:
 from __future__ import annotations
 
 import io
+import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, BinaryIO, List, Optional, Tuple
 
-from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.shared import Inches, Pt, RGBColor
 from loguru import logger
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import (
-    PageBreak,
-    Paragraph,
-    SimpleDocTemplate,
-    Spacer,
-    Table,
-    TableStyle,
+
+from app.config import settings
+from models.resume import Resume
+
+# ReportLab and python-docx are imported inside the methods that use them, so a
+# process that only renders one format (or none) never loads the other library.
+if TYPE_CHECKING:
+    from docx.document import Document
+    from docx.text.paragraph import Paragraph as DocxParagraph
+
+# XML escapes for ReportLab markup plus newline/tab handling, applied in one translate pass
+_XML_ESCAPE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", "\r": None, "\n": " ", "\t": " "}
 )
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+
+# Display form of a URL: scheme, leading "www." and one trailing slash removed
+_URL_CLEAN_RE = re.compile(r"^(?:https?://)?(?:www\.)?(.*?)/?$")
+
+
+def _sanitize(text: Optional[str]) -> str:
+    """Escape XML special characters, drop/replace control whitespace, collapse spaces"""
+    if not text:
+        return ""
+    return _MULTI_SPACE_RE.sub(" ", text.translate(_XML_ESCAPE)).strip()
 
-try:
-    from ..models.resume import Resume
-except ImportError:
-    from models.resume import Resume
+
+@dataclass
+class _PreparedResume:
+    """
+    Joined header/skills strings shared by the PDF and DOCX generators.
+    DOCX uses the raw strings (python-docx escapes XML itself); the sanitized
+    variants are only computed when a PDF asks for them, then reused.
+    """
+
+    resume: Resume
+    contact_line: str
+    link_line: str
+    skills_line: str
+
+    @cached_property
+    def sanitized_contact(self) -> str:
+        return _sanitize(self.contact_line)
+
+    @cached_property
+    def sanitized_links(self) -> str:
+        return _sanitize(self.link_line)
+
+    @cached_property
+    def sanitized_skills(self) -> str:
+        return _sanitize(self.skills_line)
+
+    @cached_property
+    def sanitized_summary(self) -> str:
+        return _sanitize(self.resume.personalInfo.summary)
+
+    @cached_property
+    def sanitized_experience(self) -> List[Tuple[str, str]]:
+        """(position, "company - location") per experience entry"""
+        return [
+            (
+                _sanitize(exp.position),
+                _sanitize(f"{exp.company} - {exp.location}" if exp.location else exp.company),
+            )
+            for exp in self.resume.experience
+        ]
 
 
 class DocumentGeneratorService:
@@ -49,44 +96,69 @@ class DocumentGeneratorService:
 
     # ATS-friendly configuration
     FONT_NAME = "Helvetica"  # Standard font available in ReportLab
+    FONT_NAME_BOLD = f"{FONT_NAME}-Bold"
+    FONT_NAME_ITALIC = f"{FONT_NAME}-Oblique"
     FONT_SIZE_NAME = 18
     FONT_SIZE_SECTION = 14
     FONT_SIZE_BODY = 11
     FONT_SIZE_SMALL = 10
 
-    COLOR_PRIMARY = colors.HexColor("#1a1a1a")  # Near-black for text
-    COLOR_SECTION = colors.HexColor("#2563eb")  # Professional blue for headers
-    COLOR_LINK = colors.HexColor("#1d4ed8")  # Darker blue for links
+    COLOR_PRIMARY = "#1a1a1a"  # Near-black for text
+    COLOR_SECTION = "#2563eb"  # Professional blue for headers
+    COLOR_LINK = "#1d4ed8"  # Darker blue for links
 
-    MARGIN = 0.75 * inch
+    # Same palette for DOCX runs (w:color values)
+    RGB_PRIMARY = "1A1A1A"
+    RGB_SECTION = "2563EB"
+    RGB_LINK = "1D4ED8"
+
+    MARGIN = 0.75 * 72  # 0.75 inch, in points
     LINE_SPACING = 1.15
 
+    # Gap after each DOCX block in points (roughly one empty 11pt line)
+    DOCX_BLOCK_SPACING = 12
+
     def __init__(self):
         """Initialize the document generator service"""
+        # Styles depend only on class constants; built once, on the first PDF
+        self._pdf_styles = None
         logger.info("Initialized DocumentGeneratorService")
 
     # ==================== PDF GENERATION ====================
 
-    def generate_pdf(self, resume: Resume) -> bytes:
+    def generate_pdf(
+        self,
+        resume: Resume,
+        sink: Optional[BinaryIO] = None,
+        prepared: Optional[_PreparedResume] = None,
+    ) -> Optional[bytes]:
         """
         Generate an ATS-friendly PDF resume.
 
         Args:
             resume: Resume model from Gemini tailoring
+            sink: Optional binary file object to write the PDF into directly
+            prepared: Output of ``prepare()`` to reuse when rendering both formats
 
         Returns:
-            PDF file as bytes
+            PDF file as bytes, or None when written to ``sink``
 
         Raises:
             Exception: If PDF generation fails
         """
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
         try:
             logger.info(
                 f"Generating PDF for resume: {resume.name} (candidate: {resume.personalInfo.name})"
             )
 
-            # Create PDF buffer
-            buffer = io.BytesIO()
+            prepared = prepared or self.prepare(resume)
+
+            # Write straight into the caller's sink when given, else an in-memory buffer
+            buffer = sink if sink is not None else io.BytesIO()
 
             # Create PDF document
             doc = SimpleDocTemplate(
@@ -98,29 +170,31 @@ class DocumentGeneratorService:
                 bottomMargin=self.MARGIN,
                 title=f"{resume.personalInfo.name} - Resume",
                 author=resume.personalInfo.name,
+                # zlib costs more than it saves on a 1-2 page text resume
+                pageCompression=int(self._text_size(resume) >= settings.PDF_COMPRESS_THRESHOLD),
             )
 
             # Build content
             story = []
-            styles = self._create_pdf_styles()
+            if self._pdf_styles is None:
+                self._pdf_styles = self._create_pdf_styles()
+            styles = self._pdf_styles
 
             # Header section
-            self._add_pdf_header(story, styles, resume)
+            self._add_pdf_header(story, styles, resume, prepared)
 
             # Summary section (if present)
-            if resume.personalInfo.summary:
+            if prepared.sanitized_summary:
                 self._add_pdf_section(story, styles, "PROFESSIONAL SUMMARY")
-                summary_para = Paragraph(
-                    self._sanitize_text(resume.personalInfo.summary), styles["Body"]
-                )
+                summary_para = Paragraph(prepared.sanitized_summary, styles["Body"])
                 story.append(summary_para)
                 story.append(Spacer(1, 0.2 * inch))
 
             # Experience section
             if resume.experience:
                 self._add_pdf_section(story, styles, "PROFESSIONAL EXPERIENCE")
-                for exp in resume.experience:
-                    self._add_pdf_experience(story, styles, exp)
+                for exp, sanitized in zip(resume.experience, prepared.sanitized_experience):
+                    self._add_pdf_experience(story, styles, exp, sanitized)
 
             # Education section
             if resume.education:
@@ -131,8 +205,7 @@ class DocumentGeneratorService:
             # Skills section
             if resume.skills:
                 self._add_pdf_section(story, styles, "TECHNICAL SKILLS")
-                skills_text = " • ".join(resume.skills)
-                skills_para = Paragraph(self._sanitize_text(skills_text), styles["Body"])
+                skills_para = Paragraph(prepared.sanitized_skills, styles["Body"])
                 story.append(skills_para)
                 story.append(Spacer(1, 0.2 * inch))
 
@@ -151,6 +224,10 @@ class DocumentGeneratorService:
             # Build PDF
             doc.build(story)
 
+            if sink is not None:
+                logger.info("Successfully generated PDF into provided sink")
+                return None
+
             # Get PDF bytes
             pdf_bytes = buffer.getvalue()
             buffer.close()
@@ -162,149 +239,200 @@ class DocumentGeneratorService:
             logger.error(f"Failed to generate PDF: {str(e)}")
             raise
 
+    def _text_size(self, resume: Resume) -> int:
+        """Rough character count of the resume's long-form text"""
+        return sum(len(d) for e in resume.experience for d in e.description) + len(
+            resume.personalInfo.summary or ""
+        )
+
+    def _register_pdf_fonts(self):
+        """Register the font family and load its metrics up front, outside the first build"""
+        from reportlab.pdfbase import pdfmetrics
+
+        try:
+            pdfmetrics.registerFontFamily(
+                self.FONT_NAME,
+                normal=self.FONT_NAME,
+                bold=self.FONT_NAME_BOLD,
+                italic=self.FONT_NAME_ITALIC,
+                boldItalic=f"{self.FONT_NAME}-BoldOblique",
+            )
+            for font_name in (self.FONT_NAME, self.FONT_NAME_BOLD, self.FONT_NAME_ITALIC):
+                pdfmetrics.getFont(font_name)
+        except Exception as e:
+            logger.warning(f"Could not preload PDF fonts, ReportLab will load them lazily: {e}")
+
     def _create_pdf_styles(self) -> dict:
         """Create custom PDF styles for ATS-friendly formatting"""
-        styles = getSampleStyleSheet()
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle, StyleSheet1
+        from reportlab.lib.units import inch
+
+        self._register_pdf_fonts()
+
+        primary = colors.HexColor(self.COLOR_PRIMARY)
+        section = colors.HexColor(self.COLOR_SECTION)
+
+        # Only the parents our styles derive from (same values as getSampleStyleSheet)
+        styles = StyleSheet1()
+        styles.add(ParagraphStyle(name="Normal"))
+        styles.add(
+            ParagraphStyle(
+                name="Heading1",
+                parent=styles["Normal"],
+                fontName=self.FONT_NAME_BOLD,
+                fontSize=18,
+                leading=22,
+                spaceAfter=6,
+            )
+        )
+        styles.add(
+            ParagraphStyle(
+                name="Heading2",
+                parent=styles["Normal"],
+                fontName=self.FONT_NAME_BOLD,
+                fontSize=14,
+                leading=18,
+                spaceBefore=12,
+                spaceAfter=6,
+            )
+        )
 
         # Name style
-        if "Name" not in styles:
-            styles.add(
-                ParagraphStyle(
-                    name="Name",
-                    parent=styles["Heading1"],
-                    fontSize=self.FONT_SIZE_NAME,
-                    textColor=self.COLOR_PRIMARY,
-                    spaceAfter=6,
-                    alignment=1,  # Center
-                    fontName=f"{self.FONT_NAME}-Bold",
-                )
+        styles.add(
+            ParagraphStyle(
+                name="Name",
+                parent=styles["Heading1"],
+                fontSize=self.FONT_SIZE_NAME,
+                textColor=primary,
+                spaceAfter=6,
+                alignment=1,  # Center
+                fontName=self.FONT_NAME_BOLD,
             )
+        )
 
         # Contact info style
-        if "Contact" not in styles:
-            styles.add(
-                ParagraphStyle(
-                    name="Contact",
-                    parent=styles["Normal"],
-                    fontSize=self.FONT_SIZE_SMALL,
-                    textColor=self.COLOR_PRIMARY,
-                    spaceAfter=12,
-                    alignment=1,  # Center
-                    fontName=self.FONT_NAME,
-                )
+        styles.add(
+            ParagraphStyle(
+                name="Contact",
+                parent=styles["Normal"],
+                fontSize=self.FONT_SIZE_SMALL,
+                textColor=primary,
+                spaceAfter=12,
+                alignment=1,  # Center
+                fontName=self.FONT_NAME,
             )
+        )
 
         # Section header style
-        if "SectionHeader" not in styles:
-            styles.add(
-                ParagraphStyle(
-                    name="SectionHeader",
-                    parent=styles["Heading2"],
-                    fontSize=self.FONT_SIZE_SECTION,
-                    textColor=self.COLOR_SECTION,
-                    spaceAfter=8,
-                    spaceBefore=12,
-                    fontName=f"{self.FONT_NAME}-Bold",
-                    borderWidth=1,
-                    borderColor=self.COLOR_SECTION,
-                    borderPadding=4,
-                    borderRadius=0,
-                )
+        styles.add(
+            ParagraphStyle(
+                name="SectionHeader",
+                parent=styles["Heading2"],
+                fontSize=self.FONT_SIZE_SECTION,
+                textColor=section,
+                spaceAfter=8,
+                spaceBefore=12,
+                fontName=self.FONT_NAME_BOLD,
+                borderWidth=1,
+                borderColor=section,
+                borderPadding=4,
+                borderRadius=0,
             )
+        )
 
         # Job title style
-        if "JobTitle" not in styles:
-            styles.add(
-                ParagraphStyle(
-                    name="JobTitle",
-                    parent=styles["Normal"],
-                    fontSize=self.FONT_SIZE_BODY,
-                    textColor=self.COLOR_PRIMARY,
-                    spaceAfter=2,
-                    fontName=f"{self.FONT_NAME}-Bold",
-                )
+        styles.add(
+            ParagraphStyle(
+                name="JobTitle",
+                parent=styles["Normal"],
+                fontSize=self.FONT_SIZE_BODY,
+                textColor=primary,
+                spaceAfter=2,
+                fontName=self.FONT_NAME_BOLD,
             )
+        )
 
         # Company style
-        if "Company" not in styles:
-            styles.add(
-                ParagraphStyle(
-                    name="Company",
-                    parent=styles["Normal"],
-                    fontSize=self.FONT_SIZE_BODY,
-                    textColor=self.COLOR_PRIMARY,
-                    spaceAfter=4,
-                    fontName=f"{self.FONT_NAME}-Oblique",
-                )
+        styles.add(
+            ParagraphStyle(
+                name="Company",
+                parent=styles["Normal"],
+                fontSize=self.FONT_SIZE_BODY,
+                textColor=primary,
+                spaceAfter=4,
+                fontName=self.FONT_NAME_ITALIC,
             )
+        )
 
         # Body text style
-        if "Body" not in styles:
-            styles.add(
-                ParagraphStyle(
-                    name="Body",
-                    parent=styles["Normal"],
-                    fontSize=self.FONT_SIZE_BODY,
-                    textColor=self.COLOR_PRIMARY,
-                    leading=self.FONT_SIZE_BODY * self.LINE_SPACING,
-                    spaceAfter=4,
-                    fontName=self.FONT_NAME,
-                )
+        styles.add(
+            ParagraphStyle(
+                name="Body",
+                parent=styles["Normal"],
+                fontSize=self.FONT_SIZE_BODY,
+                textColor=primary,
+                leading=self.FONT_SIZE_BODY * self.LINE_SPACING,
+                spaceAfter=4,
+                fontName=self.FONT_NAME,
+            )
+        )
+
+        # Smaller body text for date/issuer/technology lines
+        styles.add(
+            ParagraphStyle(
+                name="SmallBody",
+                parent=styles["Body"],
+                fontSize=self.FONT_SIZE_SMALL,
             )
+        )
+
+        # Date/technology line directly above a bullet list
+        styles.add(
+            ParagraphStyle(
+                name="EntryMeta",
+                parent=styles["SmallBody"],
+                spaceAfter=4 + 0.05 * inch,
+            )
+        )
 
         # Bullet style - use custom name to avoid conflict
-        if "ResumeBullet" not in styles:
-            styles.add(
-                ParagraphStyle(
-                    name="ResumeBullet",
-                    parent=styles["Normal"],
-                    fontSize=self.FONT_SIZE_BODY,
-                    textColor=self.COLOR_PRIMARY,
-                    leading=self.FONT_SIZE_BODY * self.LINE_SPACING,
-                    spaceAfter=3,
-                    leftIndent=20,
-                    bulletIndent=10,
-                    fontName=self.FONT_NAME,
-                )
+        styles.add(
+            ParagraphStyle(
+                name="ResumeBullet",
+                parent=styles["Normal"],
+                fontSize=self.FONT_SIZE_BODY,
+                textColor=primary,
+                leading=self.FONT_SIZE_BODY * self.LINE_SPACING,
+                spaceAfter=3,
+                leftIndent=20,
+                bulletIndent=10,
+                fontName=self.FONT_NAME,
             )
+        )
 
         return styles
 
-    def _add_pdf_header(self, story: List, styles: dict, resume: Resume):
+    def _add_pdf_header(
+        self, story: List, styles: dict, resume: Resume, prepared: _PreparedResume
+    ):
         """Add header section with name and contact info"""
-        info = resume.personalInfo
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer
 
         # Name
-        name_para = Paragraph(self._sanitize_text(info.name), styles["Name"])
+        name_para = Paragraph(self._sanitize_text(resume.personalInfo.name), styles["Name"])
         story.append(name_para)
 
         # Contact information
-        contact_parts = []
-        if info.email:
-            contact_parts.append(info.email)
-        if info.phone:
-            contact_parts.append(info.phone)
-        if info.location:
-            contact_parts.append(info.location)
-
-        if contact_parts:
-            contact_text = " • ".join(contact_parts)
-            contact_para = Paragraph(self._sanitize_text(contact_text), styles["Contact"])
+        if prepared.contact_line:
+            contact_para = Paragraph(prepared.sanitized_contact, styles["Contact"])
             story.append(contact_para)
 
         # Links
-        link_parts = []
-        if info.linkedin:
-            link_parts.append(self._clean_url(info.linkedin))
-        if info.github:
-            link_parts.append(self._clean_url(info.github))
-        if info.website:
-            link_parts.append(self._clean_url(info.website))
-
-        if link_parts:
-            link_text = " • ".join(link_parts)
+        if prepared.link_line:
             link_para = Paragraph(
-                f'<font color="{self.COLOR_LINK}">{self._sanitize_text(link_text)}</font>',
+                f'<font color="{self.COLOR_LINK}">{prepared.sanitized_links}</font>',
                 styles["Contact"],
             )
             story.append(link_para)
@@ -313,40 +441,41 @@ class DocumentGeneratorService:
 
     def _add_pdf_section(self, story: List, styles: dict, title: str):
         """Add a section header"""
+        from reportlab.platypus import Paragraph
+
         section_para = Paragraph(title, styles["SectionHeader"])
         story.append(section_para)
 
-    def _add_pdf_experience(self, story: List, styles: dict, exp):
-        """Add work experience entry"""
+    def _add_pdf_experience(
+        self, story: List, styles: dict, exp, sanitized: Tuple[str, str]
+    ):
+        """Add work experience entry (``sanitized`` is the prepared position/company pair)"""
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer
+
         # Position and Company
-        position_para = Paragraph(self._sanitize_text(exp.position), styles["JobTitle"])
+        position, company_location = sanitized
+        position_para = Paragraph(position, styles["JobTitle"])
         story.append(position_para)
 
-        company_location = exp.company
-        if exp.location:
-            company_location += f" - {exp.location}"
-
-        company_para = Paragraph(self._sanitize_text(company_location), styles["Company"])
+        company_para = Paragraph(company_location, styles["Company"])
         story.append(company_para)
 
         # Date range
         date_range = self._format_date_range(exp.startDate, exp.endDate)
-        date_para = Paragraph(
-            f'<font size="{self.FONT_SIZE_SMALL}">{date_range}</font>', styles["Body"]
-        )
+        date_para = Paragraph(self._sanitize_text(date_range), styles["EntryMeta"])
         story.append(date_para)
-        story.append(Spacer(1, 0.05 * inch))
 
         # Responsibilities/achievements
-        for desc in exp.description:
-            bullet_text = f"• {self._sanitize_text(desc)}"
-            bullet_para = Paragraph(bullet_text, styles["ResumeBullet"])
-            story.append(bullet_para)
+        self._add_pdf_bullets(story, styles, exp.description)
 
         story.append(Spacer(1, 0.15 * inch))
 
     def _add_pdf_education(self, story: List, styles: dict, edu):
         """Add education entry"""
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer
+
         # Degree and field
         degree_text = edu.degree
         if edu.field:
@@ -366,23 +495,21 @@ class DocumentGeneratorService:
             date_text += f" • GPA: {edu.gpa}"
 
         date_para = Paragraph(
-            f'<font size="{self.FONT_SIZE_SMALL}">{self._sanitize_text(date_text)}</font>',
-            styles["Body"],
+            self._sanitize_text(date_text),
+            styles["EntryMeta"] if edu.achievements else styles["SmallBody"],
         )
         story.append(date_para)
 
         # Achievements
-        if edu.achievements:
-            story.append(Spacer(1, 0.05 * inch))
-            for achievement in edu.achievements:
-                bullet_text = f"• {self._sanitize_text(achievement)}"
-                bullet_para = Paragraph(bullet_text, styles["ResumeBullet"])
-                story.append(bullet_para)
+        self._add_pdf_bullets(story, styles, edu.achievements)
 
         story.append(Spacer(1, 0.15 * inch))
 
     def _add_pdf_project(self, story: List, styles: dict, project):
         """Add project entry"""
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer
+
         # Project name
         project_name = project.name
         if project.link:
@@ -395,23 +522,31 @@ class DocumentGeneratorService:
         if project.technologies:
             tech_text = f"Technologies: {', '.join(project.technologies)}"
             tech_para = Paragraph(
-                f'<font size="{self.FONT_SIZE_SMALL}">{self._sanitize_text(tech_text)}</font>',
-                styles["Body"],
+                self._sanitize_text(tech_text),
+                styles["EntryMeta"] if project.highlights else styles["SmallBody"],
             )
             story.append(tech_para)
+        elif project.highlights:
+            story.append(Spacer(1, 0.05 * inch))
 
         # Highlights
-        if project.highlights:
-            story.append(Spacer(1, 0.05 * inch))
-            for highlight in project.highlights:
-                bullet_text = f"• {self._sanitize_text(highlight)}"
-                bullet_para = Paragraph(bullet_text, styles["ResumeBullet"])
-                story.append(bullet_para)
+        self._add_pdf_bullets(story, styles, project.highlights)
 
         story.append(Spacer(1, 0.15 * inch))
 
+    def _add_pdf_bullets(self, story: List, styles: dict, items: List[str]):
+        """Add a bullet list as one paragraph (one markup parse instead of one per bullet)"""
+        from reportlab.platypus import Paragraph
+
+        if items:
+            bullets = "<br/>".join(f"• {self._sanitize_text(item)}" for item in items)
+            story.append(Paragraph(bullets, styles["ResumeBullet"]))
+
     def _add_pdf_certification(self, story: List, styles: dict, cert):
         """Add certification entry"""
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer
+
         # Certification name
         cert_para = Paragraph(self._sanitize_text(cert.name), styles["JobTitle"])
         story.append(cert_para)
@@ -421,34 +556,43 @@ class DocumentGeneratorService:
         if cert.credentialId:
             issuer_text += f" • ID: {cert.credentialId}"
 
-        issuer_para = Paragraph(
-            f'<font size="{self.FONT_SIZE_SMALL}">{self._sanitize_text(issuer_text)}</font>',
-            styles["Body"],
-        )
+        issuer_para = Paragraph(self._sanitize_text(issuer_text), styles["SmallBody"])
         story.append(issuer_para)
 
         story.append(Spacer(1, 0.1 * inch))
 
     # ==================== DOCX GENERATION ====================
 
-    def generate_docx(self, resume: Resume) -> bytes:
+    def generate_docx(
+        self,
+        resume: Resume,
+        sink: Optional[BinaryIO] = None,
+        prepared: Optional[_PreparedResume] = None,
+    ) -> Optional[bytes]:
         """
         Generate an ATS-friendly DOCX resume.
 
         Args:
             resume: Resume model from Gemini tailoring
+            sink: Optional binary file object to write the DOCX into directly
+            prepared: Output of ``prepare()`` to reuse when rendering both formats
 
         Returns:
-            DOCX file as bytes
+            DOCX file as bytes, or None when written to ``sink``
 
         Raises:
             Exception: If DOCX generation fails
         """
+        from docx import Document
+        from docx.shared import Inches
+
         try:
             logger.info(
                 f"Generating DOCX for resume: {resume.name} (candidate: {resume.personalInfo.name})"
             )
 
+            prepared = prepared or self.prepare(resume)
+
             # Create document
             doc = Document()
 
@@ -465,14 +609,13 @@ class DocumentGeneratorService:
                 section.right_margin = Inches(0.75)
 
             # Header section
-            self._add_docx_header(doc, resume)
+            self._add_docx_header(doc, resume, prepared)
 
             # Summary section (if present)
             if resume.personalInfo.summary:
                 self._add_docx_section(doc, "PROFESSIONAL SUMMARY")
-                para = doc.add_paragraph(resume.personalInfo.summary)
-                self._format_docx_body(para)
-                doc.add_paragraph()  # Spacing
+                para = self._add_docx_body(doc, resume.personalInfo.summary)
+                self._end_docx_block(para)
 
             # Experience section
             if resume.experience:
@@ -489,10 +632,8 @@ class DocumentGeneratorService:
             # Skills section
             if resume.skills:
                 self._add_docx_section(doc, "TECHNICAL SKILLS")
-                skills_text = " • ".join(resume.skills)
-                para = doc.add_paragraph(skills_text)
-                self._format_docx_body(para)
-                doc.add_paragraph()  # Spacing
+                para = self._add_docx_body(doc, prepared.skills_line)
+                self._end_docx_block(para)
 
             # Projects section (if present)
             if resume.projects:
@@ -506,6 +647,11 @@ class DocumentGeneratorService:
                 for cert in resume.certifications:
                     self._add_docx_certification(doc, cert)
 
+            if sink is not None:
+                doc.save(sink)
+                logger.info("Successfully generated DOCX into provided sink")
+                return None
+
             # Save to buffer
             buffer = io.BytesIO()
             doc.save(buffer)
@@ -519,92 +665,57 @@ class DocumentGeneratorService:
             logger.error(f"Failed to generate DOCX: {str(e)}")
             raise
 
-    def _add_docx_header(self, doc: Document, resume: Resume):
+    def _add_docx_header(self, doc: Document, resume: Resume, prepared: _PreparedResume):
         """Add header section with name and contact info"""
-        info = resume.personalInfo
-
         # Name
-        name_para = doc.add_paragraph(info.name)
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        name_run = name_para.runs[0]
-        name_run.font.size = Pt(18)
-        name_run.font.bold = True
-        name_run.font.color.rgb = RGBColor(26, 26, 26)
+        last_para = self._emit_styled_para(
+            doc,
+            resume.personalInfo.name,
+            size_pt=18,
+            bold=True,
+            color=self.RGB_PRIMARY,
+            center=True,
+        )
 
         # Contact information
-        contact_parts = []
-        if info.email:
-            contact_parts.append(info.email)
-        if info.phone:
-            contact_parts.append(info.phone)
-        if info.location:
-            contact_parts.append(info.location)
-
-        if contact_parts:
-            contact_text = " • ".join(contact_parts)
-            contact_para = doc.add_paragraph(contact_text)
-            contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            contact_run = contact_para.runs[0]
-            contact_run.font.size = Pt(10)
-            contact_run.font.color.rgb = RGBColor(26, 26, 26)
+        if prepared.contact_line:
+            last_para = self._emit_styled_para(
+                doc, prepared.contact_line, size_pt=10, color=self.RGB_PRIMARY, center=True
+            )
 
         # Links
-        link_parts = []
-        if info.linkedin:
-            link_parts.append(self._clean_url(info.linkedin))
-        if info.github:
-            link_parts.append(self._clean_url(info.github))
-        if info.website:
-            link_parts.append(self._clean_url(info.website))
-
-        if link_parts:
-            link_text = " • ".join(link_parts)
-            link_para = doc.add_paragraph(link_text)
-            link_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            link_run = link_para.runs[0]
-            link_run.font.size = Pt(10)
-            link_run.font.color.rgb = RGBColor(29, 78, 216)  # Blue color for links
-
-        doc.add_paragraph()  # Spacing
+        if prepared.link_line:
+            last_para = self._emit_styled_para(
+                doc, prepared.link_line, size_pt=10, color=self.RGB_LINK, center=True
+            )
+
+        self._end_docx_block(last_para)
 
     def _add_docx_section(self, doc: Document, title: str):
         """Add a section header"""
-        para = doc.add_paragraph(title)
-        run = para.runs[0]
-        run.font.size = Pt(14)
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(37, 99, 235)  # Professional blue
+        self._emit_styled_para(doc, title, size_pt=14, bold=True, color=self.RGB_SECTION)
 
     def _add_docx_experience(self, doc: Document, exp):
         """Add work experience entry"""
         # Position
-        position_para = doc.add_paragraph(exp.position)
-        position_run = position_para.runs[0]
-        position_run.font.size = Pt(11)
-        position_run.font.bold = True
+        self._emit_styled_para(doc, exp.position, size_pt=11, bold=True)
 
         # Company and location
         company_text = exp.company
         if exp.location:
             company_text += f" - {exp.location}"
 
-        company_para = doc.add_paragraph(company_text)
-        company_run = company_para.runs[0]
-        company_run.font.size = Pt(11)
-        company_run.font.italic = True
+        self._emit_styled_para(doc, company_text, size_pt=11, italic=True)
 
         # Date range
         date_range = self._format_date_range(exp.startDate, exp.endDate)
-        date_para = doc.add_paragraph(date_range)
-        date_run = date_para.runs[0]
-        date_run.font.size = Pt(10)
+        last_para = self._emit_styled_para(doc, date_range, size_pt=10)
 
         # Responsibilities/achievements
         for desc in exp.description:
-            para = doc.add_paragraph(desc, style="List Bullet")
-            self._format_docx_body(para)
+            last_para = self._add_docx_body(doc, desc, bullet=True)
 
-        doc.add_paragraph()  # Spacing
+        self._end_docx_block(last_para)
 
     def _add_docx_education(self, doc: Document, edu):
         """Add education entry"""
@@ -613,16 +724,10 @@ class DocumentGeneratorService:
         if edu.field:
             degree_text += f" in {edu.field}"
 
-        degree_para = doc.add_paragraph(degree_text)
-        degree_run = degree_para.runs[0]
-        degree_run.font.size = Pt(11)
-        degree_run.font.bold = True
+        self._emit_styled_para(doc, degree_text, size_pt=11, bold=True)
 
         # Institution
-        institution_para = doc.add_paragraph(edu.institution)
-        institution_run = institution_para.runs[0]
-        institution_run.font.size = Pt(11)
-        institution_run.font.italic = True
+        self._emit_styled_para(doc, edu.institution, size_pt=11, italic=True)
 
         # Date and GPA
         date_range = self._format_date_range(edu.startDate, edu.endDate)
@@ -630,17 +735,13 @@ class DocumentGeneratorService:
         if edu.gpa:
             date_text += f" • GPA: {edu.gpa}"
 
-        date_para = doc.add_paragraph(date_text)
-        date_run = date_para.runs[0]
-        date_run.font.size = Pt(10)
+        last_para = self._emit_styled_para(doc, date_text, size_pt=10)
 
         # Achievements
-        if edu.achievements:
-            for achievement in edu.achievements:
-                para = doc.add_paragraph(achievement, style="List Bullet")
-                self._format_docx_body(para)
+        for achievement in edu.achievements:
+            last_para = self._add_docx_body(doc, achievement, bullet=True)
 
-        doc.add_paragraph()  # Spacing
+        self._end_docx_block(last_para)
 
     def _add_docx_project(self, doc: Document, project):
         """Add project entry"""
@@ -649,53 +750,116 @@ class DocumentGeneratorService:
         if project.link:
             project_name += f" ({self._clean_url(project.link)})"
 
-        project_para = doc.add_paragraph(project_name)
-        project_run = project_para.runs[0]
-        project_run.font.size = Pt(11)
-        project_run.font.bold = True
+        last_para = self._emit_styled_para(doc, project_name, size_pt=11, bold=True)
 
         # Technologies
         if project.technologies:
             tech_text = f"Technologies: {', '.join(project.technologies)}"
-            tech_para = doc.add_paragraph(tech_text)
-            tech_run = tech_para.runs[0]
-            tech_run.font.size = Pt(10)
+            last_para = self._emit_styled_para(doc, tech_text, size_pt=10)
 
         # Highlights
-        if project.highlights:
-            for highlight in project.highlights:
-                para = doc.add_paragraph(highlight, style="List Bullet")
-                self._format_docx_body(para)
+        for highlight in project.highlights:
+            last_para = self._add_docx_body(doc, highlight, bullet=True)
 
-        doc.add_paragraph()  # Spacing
+        self._end_docx_block(last_para)
 
     def _add_docx_certification(self, doc: Document, cert):
         """Add certification entry"""
         # Certification name
-        cert_para = doc.add_paragraph(cert.name)
-        cert_run = cert_para.runs[0]
-        cert_run.font.size = Pt(11)
-        cert_run.font.bold = True
+        self._emit_styled_para(doc, cert.name, size_pt=11, bold=True)
 
         # Issuer and date
         issuer_text = f"{cert.issuer} • {cert.date}"
         if cert.credentialId:
             issuer_text += f" • ID: {cert.credentialId}"
 
-        issuer_para = doc.add_paragraph(issuer_text)
-        issuer_run = issuer_para.runs[0]
-        issuer_run.font.size = Pt(10)
+        issuer_para = self._emit_styled_para(doc, issuer_text, size_pt=10)
+
+        self._end_docx_block(issuer_para)
 
-        doc.add_paragraph()  # Spacing
+    def _end_docx_block(self, para):
+        """Space the next block with paragraph spacing instead of an empty paragraph"""
+        from docx.shared import Pt
 
-    def _format_docx_body(self, para):
-        """Apply standard body formatting to a paragraph"""
-        for run in para.runs:
-            run.font.size = Pt(11)
-            run.font.color.rgb = RGBColor(26, 26, 26)
+        para.paragraph_format.space_after = Pt(self.DOCX_BLOCK_SPACING)
+
+    def _add_docx_body(self, doc: Document, text: str, bullet: bool = False):
+        """Add a paragraph with standard body formatting, optionally as a list bullet"""
+        return self._emit_styled_para(
+            doc,
+            text,
+            size_pt=11,
+            color=self.RGB_PRIMARY,
+            style_id="ListBullet" if bullet else None,
+        )
+
+    def _emit_styled_para(
+        self,
+        doc: Document,
+        text: str,
+        *,
+        size_pt: int,
+        bold: bool = False,
+        italic: bool = False,
+        color: Optional[str] = None,
+        center: bool = False,
+        style_id: Optional[str] = None,
+    ) -> DocxParagraph:
+        """
+        Build a single-run paragraph as XML and insert it into the body in one step,
+        rather than add_paragraph() followed by restyling the generated run.
+        """
+        from docx.oxml import OxmlElement
+        from docx.oxml.ns import qn
+        from docx.text.paragraph import Paragraph as DocxParagraph
+
+        p = OxmlElement("w:p")
+
+        # Paragraph properties (child order follows the WordprocessingML schema)
+        if style_id or center:
+            p_pr = OxmlElement("w:pPr")
+            if style_id:
+                p_pr.append(OxmlElement("w:pStyle", {qn("w:val"): style_id}))
+            if center:
+                p_pr.append(OxmlElement("w:jc", {qn("w:val"): "center"}))
+            p.append(p_pr)
+
+        # Run properties
+        r_pr = OxmlElement("w:rPr")
+        if bold:
+            r_pr.append(OxmlElement("w:b"))
+        if italic:
+            r_pr.append(OxmlElement("w:i"))
+        if color is not None:
+            r_pr.append(OxmlElement("w:color", {qn("w:val"): color}))
+        r_pr.append(OxmlElement("w:sz", {qn("w:val"): str(size_pt * 2)}))  # half-points
+
+        t = OxmlElement("w:t", {qn("xml:space"): "preserve"})
+        t.text = text
+
+        r = OxmlElement("w:r")
+        r.append(r_pr)
+        r.append(t)
+        p.append(r)
+
+        # _insert_p keeps the paragraph ahead of the trailing section properties
+        doc._body._element._insert_p(p)
+        return DocxParagraph(p, doc._body)
 
     # ==================== UTILITY METHODS ====================
 
+    def prepare(self, resume: Resume) -> _PreparedResume:
+        """Build the strings both formats share, so rendering PDF and DOCX joins them once"""
+        info = resume.personalInfo
+        return _PreparedResume(
+            resume=resume,
+            contact_line=" • ".join(x for x in (info.email, info.phone, info.location) if x),
+            link_line=" • ".join(
+                self._clean_url(u) for u in (info.linkedin, info.github, info.website) if u
+            ),
+            skills_line=" • ".join(resume.skills),
+        )
+
     def _format_date_range(self, start_date: str, end_date: str) -> str:
         """
         Format date range for display.
@@ -733,17 +897,7 @@ class DocumentGeneratorService:
         if not url:
             return ""
 
-        # Remove protocol
-        cleaned = url.replace("https://", "").replace("http://", "")
-
-        # Remove www.
-        cleaned = cleaned.replace("www.", "")
-
-        # Remove trailing slash
-        if cleaned.endswith("/"):
-            cleaned = cleaned[:-1]
-
-        return cleaned
+        return _URL_CLEAN_RE.match(url).group(1)
 
     def _sanitize_text(self, text: str) -> str:
         """
@@ -755,24 +909,7 @@ class DocumentGeneratorService:
         Returns:
             Sanitized text safe for PDF rendering
         """
-        if not text:
-            return ""
-
-        # Escape XML special characters for ReportLab
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-
-        # Remove problematic characters
-        text = text.replace("\n", " ")
-        text = text.replace("\r", "")
-        text = text.replace("\t", " ")
-
-        # Collapse multiple spaces
-        while "  " in text:
-            text = text.replace("  ", " ")
-
-        return text.strip()
+        return _sanitize(text)
 
 
 # Singleton instance
@@ -790,3 +927,4 @@ def get_document_generator() -> DocumentGeneratorService:
     if _document_generator is None:
         _document_generator = DocumentGeneratorService()
     return _document_generator
+
@@ -3,53 +3,87 @@ Gemini AI Service for resume tailoring
 Uses the new google-genai package
 """
 
+import asyncio
+import itertools
 import json
+import random
 import time
 import re
 import threading
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from google import genai
 from google.genai import types
 
 from app.config import settings
+from utils import prompt_cache
+from utils.json_codec import json_loads
 from utils.logger import logger, log_ai_request, log_ai_error
+from utils.rate_limit import AdaptiveLimiter
 from prompts.tailoring import (
     SYSTEM_INSTRUCTION,
+    build_tailoring_prompt,
+    compact_json,
     get_tailoring_prompt,
     get_keyword_extraction_prompt,
+    get_section_prompt,
     add_json_enforcement,
+    SECTION_NAMES,
 )
-from models.resume import Resume, TailorResponse
-
-_TAILOR_RESPONSE_SCHEMA = types.Schema(
-    type="OBJECT",
-    properties={
-        "tailoredResume": types.Schema(type="OBJECT"),
-        "matchedKeywords": types.Schema(
-            type="ARRAY",
-            items=types.Schema(type="STRING"),
-        ),
-        "missingKeywords": types.Schema(
-            type="ARRAY",
-            items=types.Schema(type="STRING"),
-        ),
-        "suggestions": types.Schema(
-            type="ARRAY",
-            items=types.Schema(type="STRING"),
-        ),
-        "changes": types.Schema(
-            type="ARRAY",
-            items=types.Schema(type="STRING"),
-        ),
-    },
-    required=[
-        "tailoredResume",
-        "matchedKeywords",
-        "missingKeywords",
-        "suggestions",
-        "changes",
-    ],
-)
+from models.resume import BULLET_MAX_LENGTH, Resume, TailorResponse
+
+# Word-like tokens in lowercased text; keeps "c++", "c#" and "node.js" whole
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+# Markdown code fences around a JSON reply (```json ... ```)
+_FENCE_RE = re.compile(r"\A```(?:json)?\s*|\s*```\Z", re.IGNORECASE)
+
+# A fully received "matchedKeywords" array inside a partial JSON response
+_MATCHED_KEYWORDS_KEY = '"matchedKeywords"'
+_MATCHED_KEYWORDS_RE = re.compile(r'"matchedKeywords"\s*:\s*(\[[^\]]*\])')
+
+# System instruction is constant, so its Content is built once at import
+_SYSTEM_INSTRUCTION_CONTENT = types.Content(parts=[types.Part(text=SYSTEM_INSTRUCTION)])
+
+# Shared by all async Gemini calls in this worker
+gemini_limiter = AdaptiveLimiter(settings.GEMINI_CONCURRENCY, settings.GEMINI_RPM)
+
+
+def _contains_keyword(key: str, tokens: set, text: str) -> bool:
+    """Whole-token lookup for single-word keywords, substring scan for phrases like ci/cd"""
+    if _TOKEN_RE.fullmatch(key):
+        return key in tokens
+    return key in text
+
+
+def _clip_bullets(bullets) -> List[str]:
+    """
+    Normalize AI bullets to a list within the BulletStr limit, cut at a word
+    boundary, so the tailored resume still validates for /generate-pdf
+    """
+    if isinstance(bullets, str):
+        bullets = bullets.split("\n")
+    clipped = []
+    for bullet in bullets:
+        text = str(bullet).strip()
+        if len(text) > BULLET_MAX_LENGTH:
+            text = text[:BULLET_MAX_LENGTH + 1].rsplit(" ", 1)[0][:BULLET_MAX_LENGTH].rstrip()
+        if text:
+            clipped.append(text)
+    return clipped
+
+
+def _strip_code_fences(text: str) -> str:
+    """Trim whitespace and any markdown fences; unfenced replies skip the regex"""
+    cleaned = text.strip()
+    if cleaned[:1] == "`" or cleaned[-1:] == "`":
+        cleaned = _FENCE_RE.sub("", cleaned)
+    return cleaned
+
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    """Heuristic check for provider 429 / quota errors"""
+    error_str = str(e).lower()
+    return "429" in error_str or "resource" in error_str or "quota" in error_str
 
 
 class TimeoutError(Exception):
@@ -97,6 +131,36 @@ def _call_with_timeout(func, timeout_seconds, *args, **kwargs):
     return result[0]
 
 
+# Queue sentinel: the stream thread has finished (successfully or not)
+_STREAM_DONE = object()
+
+
+def _pump_stream(loop, queue: asyncio.Queue, stop: threading.Event, func, **kwargs) -> None:
+    """
+    Drain a blocking SDK stream in a worker thread, handing each chunk to the event loop
+
+    google-genai 0.2.0 reads streamed replies with a synchronous iter_lines(), even
+    through client.aio, so the stream must not be consumed on the event loop thread.
+    An exception is queued in place of a chunk; _STREAM_DONE always comes last.
+    """
+    def put(item) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # Event loop already closed; nobody is waiting for the rest
+            stop.set()
+
+    try:
+        for chunk in func(**kwargs):
+            if stop.is_set():
+                break
+            put(chunk)
+    except Exception as e:
+        put(e)
+    finally:
+        put(_STREAM_DONE)
+
+
 class GeminiService:
     """Service for interacting with Gemini AI"""
 
@@ -105,134 +169,247 @@ class GeminiService:
         if not settings.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY not configured")
 
-        # Initialize client with API key from environment
-        self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        # One client per API key; requests rotate across them, skipping keys cooling down after a 429
+        self._clients = [genai.Client(api_key=key) for key in settings.gemini_api_keys]
+        self.client = self._clients[0]
         self.model = settings.GEMINI_MODEL
+        self._client_cycle = itertools.cycle(range(len(self._clients)))
+        self._cooldown: Dict[int, float] = {}
+        self._client_lock = threading.Lock()
+
+        # Static for the life of the service; built once instead of per request
+        self._config = self._generation_config()
+
+        logger.info(
+            f"✅ Gemini AI service initialized (model: {self.model}, keys: {len(self._clients)})"
+        )
+
+    def _pick_client(self) -> Tuple[int, genai.Client]:
+        """Next client in rotation that is not cooling down (or the one that frees up first)"""
+        if len(self._clients) == 1:
+            return 0, self.client
+
+        with self._client_lock:
+            now = time.monotonic()
+            for _ in range(len(self._clients)):
+                index = next(self._client_cycle)
+                if self._cooldown.get(index, 0) <= now:
+                    return index, self._clients[index]
+            index = min(self._cooldown, key=self._cooldown.get)
+            return index, self._clients[index]
+
+    def _cool_down(self, index: int) -> None:
+        """Rest a rate-limited key so the rotation moves to the others"""
+        if len(self._clients) == 1:
+            return
+        with self._client_lock:
+            self._cooldown[index] = time.monotonic() + settings.GEMINI_KEY_COOLDOWN
+        logger.warning(f"⚠️ Gemini key #{index + 1} rate limited; cooling down for {settings.GEMINI_KEY_COOLDOWN}s")
+
+    def _generation_config(self) -> types.GenerateContentConfig:
+        """Generation config shared by the sync and async request paths"""
+        return types.GenerateContentConfig(
+            temperature=settings.GEMINI_TEMPERATURE,
+            max_output_tokens=settings.GEMINI_MAX_TOKENS,
+            system_instruction=_SYSTEM_INSTRUCTION_CONTENT,
+            response_mime_type="application/json",
+        )
+
+    def _handle_response(self, response, prompt: str, duration_ms: float) -> str:
+        """Validate and log a raw Gemini response, returning its text"""
+        logger.info(f"✅ Gemini API responded in {duration_ms:.0f}ms")
+
+        # Extract text from response
+        response_text = response.text
+
+        # Validate response is not empty or truncated
+        if not response_text:
+            raise ValueError("Empty response from Gemini")
+
+        # Check if response seems truncated (doesn't end with } or ])
+        if not response_text.rstrip().endswith(('}', ']')):
+            logger.warning("⚠️ Response may be truncated, missing closing brace/bracket")
+            logger.warning(f"Response ends with: {response_text[-50:]}")
+
+        # Log successful request
+        log_ai_request(
+            model=self.model,
+            prompt_length=len(prompt),
+            response_length=len(response_text),
+            duration_ms=duration_ms,
+        )
+
+        # DEBUG: Log full response
+        logger.debug("="*80)
+        logger.debug("🔍 GEMINI RAW RESPONSE:")
+        logger.debug(f"Response length: {len(response_text)} characters")
+        logger.debug(f"Response preview: {response_text[:200]}...")
+        logger.debug(f"Response ending: ...{response_text[-200:]}")
+        logger.debug("="*80)
+
+        return response_text
+
+    def _log_timeout(self, e: Exception, prompt: str, retry_count: int) -> None:
+        """Log a timed-out Gemini call (timeouts are not retried)"""
+        logger.error(f"⏱️ Gemini API call timed out after {settings.GEMINI_TIMEOUT} seconds")
+        log_ai_error(
+            e,
+            {
+                "retry_count": retry_count,
+                "prompt_length": len(prompt),
+                "model": self.model,
+                "timeout_seconds": settings.GEMINI_TIMEOUT,
+            },
+        )
+
+    def _log_failure(self, e: Exception, prompt: str, retry_count: int) -> Optional[float]:
+        """
+        Log a failed Gemini call
+
+        Returns:
+            Backoff delay in seconds if the call should be retried, else None
+        """
+        is_rate_limit = _is_rate_limit_error(e)
+
+        if is_rate_limit:
+            logger.warning(f"⚠️ Gemini Rate Limit hit: {e}")
+            # Log full details for debugging
+            logger.debug(f"Rate Limit Details: {dir(e)}")
+            if hasattr(e, 'response'):
+                logger.debug(f"Response Headers: {e.response.headers if hasattr(e.response, 'headers') else 'N/A'}")
+                logger.debug(f"Response Content: {e.response.text if hasattr(e.response, 'text') else 'N/A'}")
+
+        # Log error with context
+        log_ai_error(
+            e,
+            {
+                "retry_count": retry_count,
+                "prompt_length": len(prompt),
+                "model": self.model,
+                "is_rate_limit": is_rate_limit
+            },
+        )
+
+        # Retry logic (only for non-timeout errors)
+        if retry_count < settings.GEMINI_RETRY_ATTEMPTS:
+            delay = settings.GEMINI_RETRY_DELAY * (2**retry_count)  # Exponential backoff
+            if is_rate_limit:
+                # Jitter so throttled callers don't retry in lockstep
+                delay += random.uniform(0, delay)
+            logger.warning(
+                f"Retrying Gemini request in {delay}s (attempt {retry_count + 1}/{settings.GEMINI_RETRY_ATTEMPTS})"
+            )
+            return delay
 
-        logger.info(f"✅ Gemini AI service initialized (model: {self.model})")
+        # All retries failed
+        logger.error(f"Gemini request failed after {settings.GEMINI_RETRY_ATTEMPTS} attempts")
+        return None
 
     def _make_request(
-        self, prompt: str, retry_count: int = 0
+        self, prompt: str
     ) -> Optional[str]:
         """
         Make a request to Gemini API with retry logic and timeout
 
         Args:
             prompt: The prompt to send
-            retry_count: Current retry attempt
 
         Returns:
             Response text or None if failed
         """
-        try:
-            start_time = time.time()
-            logger.info(f"📤 Calling Gemini API (model: {self.model}, attempt: {retry_count + 1}/{settings.GEMINI_RETRY_ATTEMPTS}, timeout: {settings.GEMINI_TIMEOUT}s)")
+        for retry_count in range(settings.GEMINI_RETRY_ATTEMPTS + 1):
+            index, client = self._pick_client()
+            try:
+                start_time = time.monotonic()
+                logger.info(f"📤 Calling Gemini API (model: {self.model}, attempt: {retry_count + 1}/{settings.GEMINI_RETRY_ATTEMPTS}, timeout: {settings.GEMINI_TIMEOUT}s)")
 
-            # Define the API call function for timeout wrapper
-            def api_call():
-                return self.client.models.generate_content(
+                # Call with timeout
+                response = _call_with_timeout(
+                    client.models.generate_content,
+                    settings.GEMINI_TIMEOUT,
                     model=self.model,
                     contents=types.Content(
                         parts=[types.Part(text=prompt)]
                     ),
-                    config=types.GenerateContentConfig(
-                        temperature=settings.GEMINI_TEMPERATURE,
-                        max_output_tokens=settings.GEMINI_MAX_TOKENS,
-                        system_instruction=types.Content(
-                            parts=[types.Part(text=SYSTEM_INSTRUCTION)]
-                        ),
-                        response_mime_type="application/json",
-                    ),
+                    config=self._config,
                 )
-            
-            # Call with timeout
-            response = _call_with_timeout(
-                api_call, 
-                settings.GEMINI_TIMEOUT
-            )
-
-            duration_ms = (time.time() - start_time) * 1000
-            logger.info(f"✅ Gemini API responded in {duration_ms:.0f}ms")
-
-            # Extract text from response
-            response_text = response.text
 
-            # Validate response is not empty or truncated
-            if not response_text:
-                raise ValueError("Empty response from Gemini")
-            
-            # Check if response seems truncated (doesn't end with } or ])
-            if not response_text.rstrip().endswith(('}', ']')):
-                logger.warning("⚠️ Response may be truncated, missing closing brace/bracket")
-                logger.warning(f"Response ends with: {response_text[-50:]}")
+                duration_ms = (time.monotonic() - start_time) * 1000
+                return self._handle_response(response, prompt, duration_ms)
 
-            # Log successful request
-            log_ai_request(
-                model=self.model,
-                prompt_length=len(prompt),
-                response_length=len(response_text),
-                duration_ms=duration_ms,
-            )
+            except TimeoutError as e:
+                # Don't retry on timeout - log and fail immediately
+                self._log_timeout(e, prompt, retry_count)
+                return None
 
-            # DEBUG: Log full response
-            logger.debug("="*80)
-            logger.debug("🔍 GEMINI RAW RESPONSE:")
-            logger.debug(f"Response length: {len(response_text)} characters")
-            logger.debug(f"Response preview: {response_text[:200]}...")
-            logger.debug(f"Response ending: ...{response_text[-200:]}")
-            logger.debug("="*80)
+            except Exception as e:
+                if _is_rate_limit_error(e):
+                    self._cool_down(index)
+                delay = self._log_failure(e, prompt, retry_count)
+                if delay is None:
+                    return None
+                time.sleep(delay)
 
-            return response_text
+        return None
 
-        except TimeoutError as e:
-            # Don't retry on timeout - log and fail immediately
-            logger.error(f"⏱️ Gemini API call timed out after {settings.GEMINI_TIMEOUT} seconds")
-            log_ai_error(
-                e,
-                {
-                    "retry_count": retry_count,
-                    "prompt_length": len(prompt),
-                    "model": self.model,
-                    "timeout_seconds": settings.GEMINI_TIMEOUT,
-                },
-            )
-            return None
+    async def _amake_request(
+        self, prompt: str
+    ) -> Optional[str]:
+        """
+        Async variant of _make_request using the aio client, so the event loop
+        is never blocked while waiting on Gemini
 
-        except Exception as e:
-            error_str = str(e).lower()
-            is_rate_limit = "429" in error_str or "resource" in error_str or "quota" in error_str
+        Args:
+            prompt: The prompt to send
 
-            if is_rate_limit:
-                logger.warning(f"⚠️ Gemini Rate Limit hit: {e}")
-                # Log full details for debugging
-                logger.debug(f"Rate Limit Details: {dir(e)}")
-                if hasattr(e, 'response'):
-                    logger.debug(f"Response Headers: {e.response.headers if hasattr(e.response, 'headers') else 'N/A'}")
-                    logger.debug(f"Response Content: {e.response.text if hasattr(e.response, 'text') else 'N/A'}")
-
-            # Log error with context
-            log_ai_error(
-                e,
-                {
-                    "retry_count": retry_count,
-                    "prompt_length": len(prompt),
-                    "model": self.model,
-                    "is_rate_limit": is_rate_limit
-                },
-            )
+        Returns:
+            Response text or None if failed
+        """
+        for retry_count in range(settings.GEMINI_RETRY_ATTEMPTS + 1):
+            index, client = self._pick_client()
+            try:
+                start_time = time.monotonic()
+                logger.info(f"📤 Calling Gemini API async (model: {self.model}, attempt: {retry_count + 1}/{settings.GEMINI_RETRY_ATTEMPTS}, timeout: {settings.GEMINI_TIMEOUT}s)")
+
+                acquired = rate_limited = False
+                try:
+                    # Queue in-process rather than letting bursts bounce off provider 429s
+                    await gemini_limiter.acquire()
+                    acquired = True
+                    response = await asyncio.wait_for(
+                        client.aio.models.generate_content(
+                            model=self.model,
+                            contents=types.Content(
+                                parts=[types.Part(text=prompt)]
+                            ),
+                            config=self._config,
+                        ),
+                        timeout=settings.GEMINI_TIMEOUT,
+                    )
+                except Exception as e:
+                    rate_limited = _is_rate_limit_error(e)
+                    if rate_limited:
+                        self._cool_down(index)
+                    raise
+                finally:
+                    if acquired:
+                        gemini_limiter.release(rate_limited)
+
+                duration_ms = (time.monotonic() - start_time) * 1000
+                return self._handle_response(response, prompt, duration_ms)
+
+            except asyncio.TimeoutError as e:
+                # Don't retry on timeout - log and fail immediately
+                self._log_timeout(e, prompt, retry_count)
+                return None
 
-            # Retry logic (only for non-timeout errors)
-            if retry_count < settings.GEMINI_RETRY_ATTEMPTS:
-                delay = settings.GEMINI_RETRY_DELAY * (2**retry_count)  # Exponential backoff
-                logger.warning(
-                    f"Retrying Gemini request in {delay}s (attempt {retry_count + 1}/{settings.GEMINI_RETRY_ATTEMPTS})"
-                )
-                time.sleep(delay)
-                return self._make_request(prompt, retry_count + 1)
+            except Exception as e:
+                delay = self._log_failure(e, prompt, retry_count)
+                if delay is None:
+                    return None
+                await asyncio.sleep(delay)
 
-            # All retries failed
-            logger.error(f"Gemini request failed after {settings.GEMINI_RETRY_ATTEMPTS} attempts")
-            return None
+        return None
 
     def _build_tailoring_prompt(
         self,
@@ -271,14 +448,7 @@ STRICT REQUIREMENTS:
             logger.debug(f"Raw text (first 500 chars): {response_text[:500]}...")
             
             # Remove markdown code blocks if present
-            cleaned = response_text.strip()
-            if cleaned.startswith("```json"):
-                cleaned = cleaned[7:]
-            if cleaned.startswith("```"):
-                cleaned = cleaned[3:]
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:-3]
-            cleaned = cleaned.strip()
+            cleaned = _strip_code_fences(response_text)
 
             # DEBUG: Log cleaned response
             logger.debug("🔍 JSON PARSING - After cleaning:")
@@ -286,7 +456,7 @@ STRICT REQUIREMENTS:
             logger.debug(f"Cleaned text (last 200 chars): ...{cleaned[-200:]}")
 
             # Parse JSON
-            parsed = json.loads(cleaned)
+            parsed = json_loads(cleaned)
             logger.info("✅ Successfully parsed JSON response from Gemini")
             
             # DEBUG: Log parsed structure
@@ -307,14 +477,7 @@ STRICT REQUIREMENTS:
             logger.warning("🔧 Attempting to repair truncated JSON...")
             try:
                 # Start with cleaned text (remove possible markdown fences)
-                repaired = response_text.strip()
-                if repaired.startswith("```json"):
-                    repaired = repaired[7:]
-                if repaired.startswith("```"):
-                    repaired = repaired[3:]
-                if repaired.endswith("```"):
-                    repaired = repaired[:-3]
-                repaired = repaired.strip()
+                repaired = _strip_code_fences(response_text)
                 
                 # If the content appears to end inside a string, close the quote
                 # Detect odd number of unescaped quotes as a heuristic
@@ -349,7 +512,7 @@ STRICT REQUIREMENTS:
                     logger.warning("Removed trailing dangling comma at end of JSON")
                 
                 # Try parsing repaired JSON
-                parsed = json.loads(repaired)
+                parsed = json_loads(repaired)
                 logger.info("✅ Successfully repaired and parsed JSON!")
                 return parsed
                 
@@ -377,18 +540,22 @@ STRICT REQUIREMENTS:
         logger.debug("="*80)
 
         prompt = add_json_enforcement(get_keyword_extraction_prompt(job_description))
-        response_text = self._make_request(prompt)
+        cache_key = prompt_cache.cache_key(prompt)
+        response_text = prompt_cache.get(cache_key) or self._make_request(prompt)
 
         if not response_text:
             logger.error("❌ KEYWORD EXTRACTION - No response from Gemini")
             return None
 
         result = self._parse_json_response(response_text)
+        if result is not None:
+            prompt_cache.put(cache_key, response_text)
         
         # DEBUG: Log final result
         if result:
             logger.debug("🔍 KEYWORD EXTRACTION - Final result:")
-            logger.debug(f"Result: {json.dumps(result, indent=2)}")
+            # Lazy so the pretty-print only runs when debug logging is on
+            logger.opt(lazy=True).debug("Result: {}", lambda: json.dumps(result, indent=2))
         
         return result
 
@@ -459,12 +626,9 @@ STRICT REQUIREMENTS:
             for exp in enhanced.experience:
                 if exp.company in tailored_exps:
                     desc = tailored_exps[exp.company]
-                    # Ensure description is always a list
-                    if isinstance(desc, str):
-                        # Split by newlines or keep as single item
-                        exp.description = [line.strip() for line in desc.split('\n') if line.strip()]
-                    elif isinstance(desc, list):
-                        exp.description = desc
+                    # Ensure description is always a list (newline-split if a string)
+                    if isinstance(desc, (str, list)):
+                        exp.description = _clip_bullets(desc)
         
         # Update project highlights (match by name)
         if "projects" in tailored:
@@ -472,11 +636,9 @@ STRICT REQUIREMENTS:
             for proj in enhanced.projects:
                 if proj.name in tailored_projs and tailored_projs[proj.name]:
                     highlights = tailored_projs[proj.name]
-                    # Ensure highlights is always a list
-                    if isinstance(highlights, str):
-                        proj.highlights = [line.strip() for line in highlights.split('\n') if line.strip()]
-                    elif isinstance(highlights, list):
-                        proj.highlights = highlights
+                    # Ensure highlights is always a list (newline-split if a string)
+                    if isinstance(highlights, (str, list)):
+                        proj.highlights = _clip_bullets(highlights)
         
         # Update skills
         if "skills" in tailored and tailored["skills"]:
@@ -484,46 +646,41 @@ STRICT REQUIREMENTS:
         
         return enhanced
     
-    def tailor_resume(
-        self, resume: Resume, job_description: str
-    ) -> Optional[TailorResponse]:
-        """
-        Tailor resume to match job description using minimal token approach
-        
-        Args:
-            resume: Complete Resume object
-            job_description: Job description text
-            
-        Returns:
-            TailorResponse with enhanced resume or None if failed
-        """
+    def _build_prompt_for_resume(self, resume: Resume, job_description: str) -> str:
+        """Build the minimal-token tailoring prompt for a resume"""
         logger.info(f"🎯 Starting resume tailoring for: {resume.personalInfo.name}")
         
         # STEP 1: Extract minimal resume data (saves 60-70% tokens)
         minimal_resume = self._extract_minimal_resume(resume)
-        minimal_json = json.dumps(minimal_resume)
-        
-        # For comparison, use model_dump_json() which handles datetime serialization
-        full_resume_json = resume.model_dump_json()
+        minimal_json = compact_json(minimal_resume)
         
+        # Size comparison is debug-only; serializing the full resume is skipped otherwise
+        def size_report() -> str:
+            full_size = len(resume.model_dump_json())
+            return (
+                f"Original resume size: ~{full_size} chars, "
+                f"minimal: ~{len(minimal_json)} chars, "
+                f"token savings: ~{100 - (len(minimal_json) / full_size * 100):.1f}%"
+            )
+
         logger.debug("="*80)
         logger.debug("🔍 MINIMAL RESUME EXTRACTION:")
-        logger.debug(f"Original resume size: ~{len(full_resume_json)} chars")
-        logger.debug(f"Minimal resume size: ~{len(minimal_json)} chars")
-        logger.debug(f"Token savings: ~{100 - (len(minimal_json) / len(full_resume_json) * 100):.1f}%")
+        logger.opt(lazy=True).debug("{}", size_report)
         logger.debug("="*80)
         
         # STEP 2: Generate prompt with minimal data
         prompt = add_json_enforcement(
-            get_tailoring_prompt(minimal_resume, job_description, resume.personalInfo.name)
+            build_tailoring_prompt(minimal_json, job_description, resume.personalInfo.name)
         )
         
         logger.debug("🔍 Generated prompt:")
         logger.debug(f"Prompt length: {len(prompt)} characters")
-        
-        # STEP 3: Get Gemini response
-        response_text = self._make_request(prompt)
-        
+        return prompt
+
+    def _build_tailor_response(
+        self, resume: Resume, response_text: Optional[str]
+    ) -> Optional[TailorResponse]:
+        """Parse Gemini's reply and merge it into a TailorResponse"""
         if not response_text:
             logger.error("❌ Failed to get response from Gemini")
             return None
@@ -567,6 +724,310 @@ STRICT REQUIREMENTS:
             logger.exception("Full traceback:")
             return None
 
+    def tailor_resume(
+        self, resume: Resume, job_description: str
+    ) -> Optional[TailorResponse]:
+        """
+        Tailor resume to match job description using minimal token approach
+        
+        Args:
+            resume: Complete Resume object
+            job_description: Job description text
+            
+        Returns:
+            TailorResponse with enhanced resume or None if failed
+        """
+        prompt = self._build_prompt_for_resume(resume, job_description)
+        
+        # STEP 3: Get Gemini response
+        response_text = self._make_request(prompt)
+        return self._build_tailor_response(resume, response_text)
+
+    async def atailor_resume(
+        self, resume: Resume, job_description: str
+    ) -> Optional[TailorResponse]:
+        """
+        Async variant of tailor_resume for use from request handlers
+        
+        Args:
+            resume: Complete Resume object
+            job_description: Job description text
+            
+        Returns:
+            TailorResponse with enhanced resume or None if failed
+        """
+        prompt = self._build_prompt_for_resume(resume, job_description)
+        
+        # STEP 3: Get Gemini response without blocking the event loop
+        response_text = await self._amake_request(prompt)
+        return self._build_tailor_response(resume, response_text)
+
+    async def atailor_resume_stream(
+        self, resume: Resume, job_description: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Tailor a resume while streaming progress from Gemini
+
+        Yields events as {"event": name, "data": payload}:
+        - progress: characters received so far
+        - keywords: matchedKeywords, as soon as that array is complete
+        - result: the final TailorResponse
+        - error: message describing why tailoring failed
+        """
+        prompt = self._build_prompt_for_resume(resume, job_description)
+        logger.info(f"📤 Streaming Gemini API (model: {self.model}, timeout: {settings.GEMINI_TIMEOUT}s)")
+
+        start_time = time.monotonic()
+        deadline = start_time + settings.GEMINI_TIMEOUT
+        parts: List[str] = []
+        received = 0
+        keywords_sent = False
+        # Unsearched tail of the reply, so each chunk is scanned once rather than re-joining everything
+        keywords_window = ""
+
+        index, client = self._pick_client()
+        acquired = rate_limited = False
+        chunks: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        try:
+            await gemini_limiter.acquire()
+            acquired = True
+            # The SDK reads the stream synchronously, so a worker thread drives it
+            threading.Thread(
+                target=_pump_stream,
+                args=(asyncio.get_running_loop(), chunks, stop, client.models.generate_content_stream),
+                kwargs={
+                    "model": self.model,
+                    "contents": types.Content(parts=[types.Part(text=prompt)]),
+                    "config": self._config,
+                },
+                daemon=True,
+            ).start()
+            while True:
+                chunk = await asyncio.wait_for(
+                    chunks.get(), timeout=max(deadline - time.monotonic(), 0)
+                )
+                if chunk is _STREAM_DONE:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+
+                text = chunk.text or ""
+                if not text:
+                    continue
+                parts.append(text)
+                received += len(text)
+                yield {"event": "progress", "data": {"chars": received}}
+
+                if not keywords_sent:
+                    keywords_window += text
+                    match = _MATCHED_KEYWORDS_RE.search(keywords_window)
+                    if match:
+                        try:
+                            keywords = json_loads(match.group(1))
+                        except ValueError:
+                            keywords = None
+                        if isinstance(keywords, list):
+                            keywords_sent = True
+                            yield {"event": "keywords", "data": {"matchedKeywords": keywords}}
+                    else:
+                        # Keep from the key onwards (array still arriving), or just enough to catch a split key
+                        start = keywords_window.find(_MATCHED_KEYWORDS_KEY)
+                        keywords_window = (
+                            keywords_window[start:]
+                            if start >= 0
+                            else keywords_window[-len(_MATCHED_KEYWORDS_KEY):]
+                        )
+
+        except asyncio.TimeoutError as e:
+            self._log_timeout(e, prompt, 0)
+            yield {"event": "error", "data": {"message": "Gemini API call timed out"}}
+            return
+
+        except Exception as e:
+            rate_limited = _is_rate_limit_error(e)
+            if rate_limited:
+                self._cool_down(index)
+            log_ai_error(
+                e,
+                {
+                    "prompt_length": len(prompt),
+                    "model": self.model,
+                    "is_rate_limit": rate_limited,
+                    "streaming": True,
+                },
+            )
+            yield {"event": "error", "data": {"message": "Gemini API request failed"}}
+            return
+
+        finally:
+            # Tell the stream thread to stop at its next chunk if we gave up early
+            stop.set()
+            if acquired:
+                gemini_limiter.release(rate_limited)
+
+        response_text = "".join(parts)
+        duration_ms = (time.monotonic() - start_time) * 1000
+        if response_text:
+            log_ai_request(
+                model=self.model,
+                prompt_length=len(prompt),
+                response_length=len(response_text),
+                duration_ms=duration_ms,
+            )
+
+        tailor_response = self._build_tailor_response(resume, response_text)
+        if tailor_response is None:
+            yield {"event": "error", "data": {"message": "Failed to tailor resume"}}
+            return
+        yield {"event": "result", "data": tailor_response}
+
+    async def _arequest_json(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Send a prompt through the async client and parse the JSON reply
+
+        Replies are cached by exact prompt, so re-tailoring against the same job
+        description reuses the keyword extraction and any unchanged sections.
+        """
+        cache_key = prompt_cache.cache_key(prompt)
+        response_text = prompt_cache.get(cache_key)
+        if response_text is None:
+            response_text = await self._amake_request(prompt)
+            if not response_text:
+                return None
+
+        result = self._parse_json_response(response_text)
+        if result is not None:
+            prompt_cache.put(cache_key, response_text)
+        return result
+
+    async def aextract_keywords(self, job_description: str) -> List[str]:
+        """
+        Extract a flat, de-duplicated keyword list from a job description
+
+        Args:
+            job_description: The job description text
+
+        Returns:
+            Technical and soft skill keywords (empty if extraction failed)
+        """
+        result = await self._arequest_json(
+            add_json_enforcement(get_keyword_extraction_prompt(job_description))
+        )
+        if not result:
+            return []
+
+        keywords: List[str] = []
+        seen = set()
+        for key in ("technical_skills", "soft_skills"):
+            for keyword in result.get(key) or []:
+                if not isinstance(keyword, str) or not keyword.strip():
+                    continue
+                if keyword.lower() not in seen:
+                    seen.add(keyword.lower())
+                    keywords.append(keyword.strip())
+        return keywords
+
+    async def atailor_section(
+        self, section_name: str, section_data: Any, job_description: str, keywords: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Tailor a single resume section
+
+        Args:
+            section_name: One of summary, experiences, projects, skills
+            section_data: That section from the minimal resume
+            job_description: Job description text
+            keywords: Keywords extracted once from the job description
+
+        Returns:
+            Parsed JSON for the section or None if failed
+        """
+        logger.info(f"🧩 Tailoring section: {section_name}")
+        prompt = add_json_enforcement(
+            get_section_prompt(section_name, section_data, job_description, keywords)
+        )
+        return await self._arequest_json(prompt)
+
+    async def atailor_resume_by_section(
+        self, resume: Resume, job_description: str
+    ) -> Optional[TailorResponse]:
+        """
+        Tailor a resume with one concurrent Gemini call per section
+
+        Keywords are extracted once up front and shared by every section call;
+        matched/missing keywords are then computed locally from the merged resume.
+        Sections whose call fails keep their original content.
+
+        Args:
+            resume: Complete Resume object
+            job_description: Job description text
+
+        Returns:
+            TailorResponse with enhanced resume or None if failed
+        """
+        logger.info(f"🎯 Starting section-parallel tailoring for: {resume.personalInfo.name}")
+        minimal_resume = self._extract_minimal_resume(resume)
+        keywords = await self.aextract_keywords(job_description)
+
+        names = [name for name in SECTION_NAMES if minimal_resume.get(name)]
+        results = await asyncio.gather(
+            *(
+                self.atailor_section(name, minimal_resume[name], job_description, keywords)
+                for name in names
+            )
+        )
+
+        tailored: Dict[str, Any] = {}
+        changes: List[str] = []
+        suggestions: List[str] = []
+        for name, result in zip(names, results):
+            if not result or name not in result:
+                logger.warning(f"⚠️ Section '{name}' was not tailored; keeping original content")
+                continue
+            tailored[name] = result[name]
+            changes.extend(result.get("changes") or [])
+            suggestions.extend(result.get("suggestions") or [])
+
+        if not tailored:
+            logger.error("❌ No resume section could be tailored")
+            return None
+
+        try:
+            enhanced_resume = self._merge_tailored_content(resume, tailored)
+        except Exception as e:
+            logger.error(f"❌ Failed to merge tailored content: {e}")
+            logger.exception("Full traceback:")
+            return None
+
+        matched, missing = self._match_keywords(
+            keywords, self._extract_resume_text(enhanced_resume).lower()
+        )
+
+        return TailorResponse(
+            tailoredResume=enhanced_resume,
+            atsScore=self._calculate_ats_score(matched, missing),
+            matchedKeywords=matched,
+            missingKeywords=missing,
+            suggestions=suggestions,
+            changes=changes,
+        )
+
+    def _match_keywords(self, keywords: List[str], resume_text: str) -> Tuple[List[str], List[str]]:
+        """
+        Split keywords into (matched, missing) against lowercased resume text
+
+        Single-token keywords are looked up in a token set built once, so "Go" no
+        longer matches inside "good"; phrases like "CI/CD" fall back to a substring scan.
+        """
+        resume_tokens = set(_TOKEN_RE.findall(resume_text))
+        matched: List[str] = []
+        missing: List[str] = []
+        for keyword in keywords:
+            found = _contains_keyword(keyword.lower(), resume_tokens, resume_text)
+            (matched if found else missing).append(keyword)
+        return matched, missing
+
     def _calculate_ats_score(self, matched: list, missing: list) -> int:
         """Calculate ATS score based on keyword matching"""
         if not matched and not missing:
@@ -579,43 +1040,6 @@ STRICT REQUIREMENTS:
         score = int((len(matched) / total) * 100)
         return max(0, min(100, score))
 
-    def _fallback_match_keywords(self, resume: Resume, job_description: str) -> list:
-        """Fallback keyword matching when AI response doesn't provide them.
-
-        Uses a simple intersection between resume skills and job description tokens.
-        """
-        jd_tokens = set(
-            token.lower().strip(".,!?;:/()[]{}")
-            for token in job_description.split()
-            if len(token) >= 2
-        )
-        
-        # Flatten skills if they are a dict
-        if isinstance(resume.skills, dict):
-            flat_skills = []
-            for category_skills in resume.skills.values():
-                flat_skills.extend(category_skills)
-            resume_skills = {skill.lower() for skill in flat_skills}
-            
-            # For ordered return, we need a flat list again
-            original_skills_ordered = flat_skills
-        else:
-            resume_skills = {skill.lower() for skill in resume.skills}
-            original_skills_ordered = resume.skills
-
-        matched = sorted(list(resume_skills.intersection(jd_tokens)))
-        # Return capitalized form based on original skills order
-        ordered = [skill for skill in original_skills_ordered if skill.lower() in matched]
-        # De-duplicate while preserving order
-        seen = set()
-        final_ordered = []
-        for s in ordered:
-            if s.lower() not in seen:
-                final_ordered.append(s)
-                seen.add(s.lower())
-                
-        return final_ordered
-
     def _is_resume_unchanged(self, original: Resume, tailored: Resume) -> bool:
         """Check if tailored resume is identical to the original."""
         original_data = original.model_dump(mode="json", exclude_none=False)
@@ -629,7 +1053,7 @@ STRICT REQUIREMENTS:
         - Ensure `experience` and `skills` are non-empty; fallback to originals
         - Preserve `projects` and `education` if AI drops them entirely
         """
-        orig = json.loads(original.model_dump_json())
+        orig = original.model_dump(mode="json")
 
         # Personal info: fill nulls from original
         if "personalInfo" in ai_data and isinstance(ai_data["personalInfo"], dict):
@@ -699,11 +1123,25 @@ STRICT REQUIREMENTS:
 
 # Singleton instance
 _gemini_service: Optional[GeminiService] = None
+_gemini_lock = threading.Lock()
 
 
 def get_gemini_service() -> GeminiService:
-    """Get or create Gemini service instance"""
+    """
+    Get or create Gemini service instance
+
+    Created eagerly by the app startup hook, so request-time calls are a
+    global lookup. Kept as a module global rather than functools.lru_cache
+    so tests can reset it by assigning _gemini_service = None. The lock is
+    only taken until the first instance exists, so two threads racing on a
+    cold start cannot both build a client.
+    """
     global _gemini_service
-    if _gemini_service is None:
-        _gemini_service = GeminiService()
-    return _gemini_service
+    service = _gemini_service
+    if service is not None:
+        return service
+
+    with _gemini_lock:
+        if _gemini_service is None:
+            _gemini_service = GeminiService()
+        return _gemini_service
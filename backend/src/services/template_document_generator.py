@@ -42,10 +42,7 @@ except OSError as e:
         def __init__(self, *args, **kwargs):
             pass
 
-try:
-    from ..models.resume import Resume
-except ImportError:
-    from models.resume import Resume
+from models.resume import Resume
 
 
 class TemplateDocumentGenerator:
@@ -445,5 +442,21 @@ class TemplateDocumentGenerator:
             date_str = f"({cert.date})" if cert.date else ""
             self._create_two_col_row(doc, f"{cert.name} - {cert.issuer}", date_str)
 
+# Singleton instance (default template directory only)
+_template_generator: Optional[TemplateDocumentGenerator] = None
+
+
 def get_template_generator(template_dir: Optional[str] = None) -> TemplateDocumentGenerator:
-    return TemplateDocumentGenerator(template_dir=template_dir)
+    """
+    Get the shared TemplateDocumentGenerator.
+
+    The default-directory instance is created once and reused so the Jinja2
+    environment (and its compiled template cache) survives across requests.
+    Passing an explicit template_dir returns a fresh, uncached instance.
+    """
+    global _template_generator
+    if template_dir is not None:
+        return TemplateDocumentGenerator(template_dir=template_dir)
+    if _template_generator is None:
+        _template_generator = TemplateDocumentGenerator()
+    return _template_generator
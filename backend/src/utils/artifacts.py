@@ -5,8 +5,11 @@ Creates a unique folder per tailoring session and keeps track of latest by resum
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
+import os
+import threading
 import time
 import re
 import json
@@ -18,8 +21,18 @@ from utils.logger import logger
 BASE_DIR = Path(__file__).resolve().parent.parent.parent / "artifacts"
 BASE_DIR.mkdir(parents=True, exist_ok=True)
 
-# In-memory map of latest session path per resume id
-_latest_sessions: Dict[str, Path] = {}
+# In-memory LRU map of latest session path per resume id
+_MAX_TRACKED_SESSIONS = 256
+_latest_sessions: "OrderedDict[str, Path]" = OrderedDict()
+_sessions_lock = threading.Lock()  # sessions are resolved from worker threads
+
+
+def _remember_session(resume_id: str, path: Path) -> None:
+    with _sessions_lock:
+        _latest_sessions[resume_id] = path
+        _latest_sessions.move_to_end(resume_id)
+        while len(_latest_sessions) > _MAX_TRACKED_SESSIONS:
+            _latest_sessions.popitem(last=False)
 
 
 def _sanitize(value: Optional[str]) -> str:
@@ -36,14 +49,26 @@ def start_session(resume: Resume, target_role: Optional[str] = None) -> Path:
     role = _sanitize(target_role) if target_role else "general"
     path = BASE_DIR / candidate / resume_id / f"{ts}-{role}"
     path.mkdir(parents=True, exist_ok=True)
-    _latest_sessions[resume.id] = path
+    _remember_session(resume.id, path)
     logger.info(f"📁 Artifact session created: {path}")
     return path
 
 
 def get_latest_session(resume_id: str) -> Optional[Path]:
     """Return the latest session path for a resume id, if any."""
-    return _latest_sessions.get(resume_id)
+    with _sessions_lock:
+        path = _latest_sessions.get(resume_id)
+        if path is not None:
+            _latest_sessions.move_to_end(resume_id)
+    return path
+
+
+def ensure_session(resume: Resume) -> Path:
+    """Return the latest session for this resume, creating one if missing or deleted."""
+    path = get_latest_session(resume.id)
+    if path is not None and os.path.isdir(path):
+        return path
+    return start_session(resume)
 
 
 def save_json(path: Path, data: Union[Dict[str, Any], str], filename: Optional[str] = None) -> Path:
@@ -0,0 +1,93 @@
+"""
+Background artifact writer
+Moves artifact disk writes off the request path; a daemon thread drains a bounded
+queue in batches and fsyncs each batch after all of its files are written.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+import atexit
+import os
+import queue
+import threading
+
+from utils.logger import logger
+
+
+class AsyncArtifactWriter:
+    """Queue-backed file writer drained by a single daemon thread"""
+
+    def __init__(self, max_queue: int = 1024, max_batch: int = 32):
+        self._queue: "queue.Queue[Tuple[Path, bytes]]" = queue.Queue(maxsize=max_queue)
+        self._max_batch = max_batch
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="artifact-writer", daemon=True
+                )
+                self._thread.start()
+
+    def enqueue(self, path: Path, data: bytes) -> None:
+        """Schedule data to be written to path (blocks only if the queue is full)."""
+        self._ensure_started()
+        self._queue.put((path, data))
+
+    def flush(self) -> None:
+        """Block until every queued write has been flushed to disk."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[Path, bytes]]) -> None:
+        # Write everything first, then fsync, so the kernel can coalesce the I/O
+        opened = []
+        for path, data in batch:
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            except OSError as e:
+                logger.error(f"Failed to open artifact {path}: {e}")
+                continue
+            try:
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                opened.append((fd, path, len(data)))
+            except OSError as e:
+                os.close(fd)
+                logger.error(f"Failed to write artifact {path}: {e}")
+
+        for fd, path, size in opened:
+            try:
+                os.fsync(fd)
+                logger.info(f"📝 Saved artifact: {path} ({size} bytes)")
+            except OSError as e:
+                logger.error(f"Failed to fsync artifact {path}: {e}")
+            finally:
+                os.close(fd)
+
+
+# Shared writer; pending writes are flushed at interpreter exit
+artifact_writer = AsyncArtifactWriter()
+atexit.register(artifact_writer.flush)
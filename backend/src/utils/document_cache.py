@@ -0,0 +1,44 @@
+"""
+In-process cache of rendered documents
+Re-downloading the same resume (or fetching it again after a failed save) skips rendering.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+
+from app.config import settings
+from models.resume import Resume
+
+# key -> rendered bytes, least recently used first
+_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+
+def cache_key(resume: Resume, template: str, fmt: str) -> bytes:
+    """Build a key from the full resume content, template name and output format."""
+    digest = hashlib.blake2b(resume.model_dump_json().encode(), digest_size=16)
+    digest.update(f"|{template}|{fmt}".encode())
+    return digest.digest()
+
+
+def get(key: bytes) -> Optional[bytes]:
+    """Return cached document bytes if present."""
+    data = _cache.get(key)
+    if data is not None:
+        _cache.move_to_end(key)
+    return data
+
+
+def put(key: bytes, data: bytes) -> None:
+    """Store document bytes, evicting the least recently used entries beyond the cap."""
+    _cache[key] = data
+    _cache.move_to_end(key)
+    while len(_cache) > settings.DOCUMENT_CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+def clear() -> None:
+    """Drop all cached documents."""
+    _cache.clear()
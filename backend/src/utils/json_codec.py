@@ -0,0 +1,18 @@
+"""
+Fast JSON decoding shared across modules
+Uses orjson when installed and falls back to the stdlib json module
+"""
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+
+    json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+__all__ = ["ORJSON_AVAILABLE", "json_loads"]
@@ -6,7 +6,7 @@ All application logs go to a single file for easy debugging
 import sys
 from loguru import logger
 from pathlib import Path
-from app.config import settings
+from app.config import settings, startup_messages
 
 # Remove default handler
 logger.remove()
@@ -79,7 +79,11 @@ logger.add(
 def log_request(method: str, path: str, status_code: int, duration_ms: float):
     """Log HTTP request with timing information"""
     logger.info(
-        f"HTTP {method} {path} - {status_code} - {duration_ms:.2f}ms",
+        "HTTP {} {} - {} - {:.2f}ms",
+        method,
+        path,
+        status_code,
+        duration_ms,
         extra={
             "service": "api",
             "method": method,
@@ -137,6 +141,11 @@ logger.info(f"📁 Log directory: {log_dir}")
 logger.info(f"📊 Log level: {settings.LOG_LEVEL}")
 logger.info("=" * 80)
 
+# Flush configuration messages recorded before the sinks existed
+for _level, _message in startup_messages:
+    logger.log(_level, _message)
+startup_messages.clear()
+
 
 # Export logger
 __all__ = ["logger", "log_request", "log_ai_request", "log_ai_error", "log_error"]
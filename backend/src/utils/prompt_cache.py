@@ -0,0 +1,47 @@
+"""
+In-process cache of raw Gemini replies for keyword-extraction and section prompts
+The same job description (or an unchanged resume section) is only sent to Gemini once.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+import hashlib
+import time
+
+from app.config import settings
+
+# key -> (stored_at_monotonic, response_text), least recently used first
+_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+
+
+def cache_key(prompt: str) -> bytes:
+    """Build a key from the exact prompt text."""
+    return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+
+def get(key: bytes) -> Optional[str]:
+    """Return a cached reply if present and not expired."""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    stored_at, response_text = entry
+    if time.monotonic() - stored_at > settings.TAILOR_CACHE_TTL:
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    return response_text
+
+
+def put(key: bytes, response_text: str) -> None:
+    """Store a reply, evicting the least recently used entries beyond the cap."""
+    _cache[key] = (time.monotonic(), response_text)
+    _cache.move_to_end(key)
+    while len(_cache) > settings.PROMPT_CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+def clear() -> None:
+    """Drop all cached replies."""
+    _cache.clear()
@@ -0,0 +1,138 @@
+"""
+Client-side rate limiting for upstream AI calls
+Queues requests in-process instead of letting them all hit the provider and bounce off 429s.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict
+import asyncio
+import time
+
+from fastapi import HTTPException, status
+
+_WINDOW_SECONDS = 60.0
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency cap plus a sliding-window requests-per-minute gate.
+
+    The concurrency limit is halved when the provider rate-limits a call and
+    grows back by one per successful call, up to ``max_concurrency``.
+    Callers waiting for a slot are served first come, first served.
+    State is only touched from the event loop, so no lock is needed.
+    """
+
+    def __init__(self, max_concurrency: int, rpm: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = self.max_concurrency
+        self.rpm = rpm
+        self.in_flight = 0
+        self._calls: Deque[float] = deque()
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        """
+        Wait for budget in the RPM window, then for a concurrency slot.
+
+        The slot is only taken once the wait is over, so a caller cancelled
+        while waiting holds nothing and must not call release().
+        """
+        await self._wait_for_rpm_budget()
+
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as the wait was cancelled; pass it on
+                self.in_flight -= 1
+                self._wake_waiters()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    async def _wait_for_rpm_budget(self) -> None:
+        if self.rpm <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= _WINDOW_SECONDS:
+                self._calls.popleft()
+            if len(self._calls) < self.rpm:
+                self._calls.append(now)
+                return
+            await asyncio.sleep(_WINDOW_SECONDS - (now - self._calls[0]))
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to the oldest waiters."""
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def release(self, rate_limited: bool = False) -> None:
+        """Free the slot and adapt the concurrency limit to the call outcome."""
+        self.in_flight -= 1
+        if rate_limited:
+            self.limit = max(1, self.limit // 2)
+        elif self.limit < self.max_concurrency:
+            self.limit += 1
+        self._wake_waiters()
+
+    def snapshot(self) -> Dict[str, int]:
+        """Current limiter state for status endpoints."""
+        return {
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "concurrency_limit": self.limit,
+            "max_concurrency": self.max_concurrency,
+            "rpm_limit": self.rpm,
+            "calls_last_minute": len(self._calls),
+        }
+
+
+class RequestLimiter:
+    """
+    Caps concurrent executions of an expensive endpoint.
+
+    Requests beyond the cap are rejected immediately with 503 + Retry-After
+    instead of queueing, so admitted requests keep a bounded latency.
+    """
+
+    def __init__(self, max_in_flight: int, retry_after_seconds: int = 5):
+        self.max_in_flight = max(1, max_in_flight)
+        self.retry_after_seconds = retry_after_seconds
+        self.in_flight = 0
+
+    def ensure_capacity(self) -> None:
+        """Raise 503 if the endpoint is saturated."""
+        if self.in_flight >= self.max_in_flight:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy processing other requests. Please retry shortly.",
+                headers={"Retry-After": str(self.retry_after_seconds)},
+            )
+
+    def acquire(self) -> None:
+        """Take a slot or raise 503 if the endpoint is saturated."""
+        self.ensure_capacity()
+        self.in_flight += 1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+
+    async def __aenter__(self) -> "RequestLimiter":
+        self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
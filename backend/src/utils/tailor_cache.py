@@ -0,0 +1,80 @@
+"""
+In-process cache of tailoring results
+Repeat submissions of the same resume + job description skip the Gemini call entirely.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+import hashlib
+import re
+import time
+import unicodedata
+
+from app.config import settings
+from models.resume import TailorRequest, TailorResponse
+
+# Results below this score are not cached so a poor answer isn't replayed
+MIN_CACHEABLE_SCORE = 50
+
+# Fields that change between otherwise identical submissions
+_VOLATILE_RESUME_FIELDS = {"id", "name", "createdAt", "updatedAt"}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# key -> (stored_at_monotonic, response), oldest first
+_cache: "OrderedDict[str, Tuple[float, TailorResponse]]" = OrderedDict()
+
+
+def _normalize_job_description(text: str) -> str:
+    text = unicodedata.normalize("NFC", text)
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def cache_key(request: TailorRequest) -> str:
+    """Build a stable key from the resume content, job description and target role."""
+    digest = hashlib.sha256(
+        request.resume.model_dump_json(exclude=_VOLATILE_RESUME_FIELDS).encode()
+    )
+    digest.update(b"|")
+    digest.update(_normalize_job_description(request.jobDescription).encode())
+    digest.update(b"|")
+    digest.update((request.targetRole or "").encode())
+    return digest.hexdigest()
+
+
+def get(key: str, request: TailorRequest) -> Optional[TailorResponse]:
+    """
+    Return a cached response if present and not expired.
+
+    The key ignores the volatile resume fields, so the hit is re-stamped with
+    the requester's own id, name and timestamps.
+    """
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    stored_at, response = entry
+    if time.monotonic() - stored_at > settings.TAILOR_CACHE_TTL:
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    stamp = {field: getattr(request.resume, field) for field in _VOLATILE_RESUME_FIELDS}
+    return response.model_copy(
+        update={"tailoredResume": response.tailoredResume.model_copy(update=stamp)}
+    )
+
+
+def put(key: str, response: TailorResponse) -> None:
+    """Store a response, evicting the least recently used entries beyond the cap."""
+    if response.atsScore < MIN_CACHEABLE_SCORE:
+        return
+    _cache[key] = (time.monotonic(), response)
+    _cache.move_to_end(key)
+    while len(_cache) > settings.TAILOR_CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+def clear() -> None:
+    """Drop all cached responses."""
+    _cache.clear()
@@ -26,8 +26,9 @@ from models.resume import (
 
 @pytest.fixture(scope="session")
 def test_client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a test client for the FastAPI app (runs startup/shutdown events)"""
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture
@@ -187,6 +188,36 @@ def env_setup(monkeypatch):
     monkeypatch.setenv("LOG_LEVEL", "ERROR")  # Reduce logging in tests
 
 
+@pytest.fixture(autouse=True)
+def clear_tailor_cache():
+    """Keep cached tailoring results from leaking between tests"""
+    from utils import tailor_cache
+
+    tailor_cache.clear()
+    yield
+    tailor_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    """Keep cached rendered documents from leaking between tests"""
+    from utils import document_cache
+
+    document_cache.clear()
+    yield
+    document_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_prompt_cache():
+    """Keep cached Gemini replies from leaking between tests"""
+    from utils import prompt_cache
+
+    prompt_cache.clear()
+    yield
+    prompt_cache.clear()
+
+
 @pytest.fixture
 def mock_gemini_response(sample_resume):
     """Mock successful Gemini API response"""
@@ -221,6 +252,7 @@ def mock_gemini_client(mocker, mock_gemini_response):
     mock_response.text = json.dumps(mock_gemini_response)
     
     mock_client.models.generate_content.return_value = mock_response
+    mock_client.aio.models.generate_content = mocker.AsyncMock(return_value=mock_response)
     
     # Patch the Client class
     mocker.patch("services.gemini.genai.Client", return_value=mock_client)
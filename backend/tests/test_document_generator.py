@@ -0,0 +1,83 @@
+"""
+Unit tests for the ReportLab/python-docx DocumentGeneratorService
+"""
+import pytest
+
+from services.document_generator import DocumentGeneratorService
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("end_date", ["Present", "present", "PRESENT", "PreSent"])
+def test_format_date_range_normalizes_present_in_any_case(end_date):
+    """Test that any casing of Present renders as "Present" """
+    generator = DocumentGeneratorService()
+    assert generator._format_date_range("2020-01", end_date) == "2020-01 - Present"
+
+
+@pytest.mark.unit
+def test_format_date_range_keeps_regular_end_date():
+    """Test that a regular end date is rendered unchanged"""
+    generator = DocumentGeneratorService()
+    assert generator._format_date_range("2020-01", "2021-12") == "2020-01 - 2021-12"
+    assert generator._format_date_range("2020-01", None) == "2020-01"
+
+
+@pytest.mark.unit
+def test_pdf_styles_are_all_defined():
+    """Test the stylesheet carries every style the PDF sections look up"""
+    styles = DocumentGeneratorService()._create_pdf_styles()
+
+    for name in ("Name", "Contact", "SectionHeader", "JobTitle", "Company", "Body",
+                 "SmallBody", "EntryMeta", "ResumeBullet"):
+        assert name in styles
+    assert styles["Name"].parent is styles["Heading1"]
+    assert styles["SmallBody"].fontSize == DocumentGeneratorService.FONT_SIZE_SMALL
+
+
+@pytest.mark.unit
+def test_generate_pdf_renders_bullets_as_one_paragraph(sample_resume):
+    """Test a small resume is left uncompressed and its bullets share one text block"""
+    generator = DocumentGeneratorService()
+    pdf = generator.generate_pdf(sample_resume)
+
+    assert pdf.startswith(b"%PDF")
+    assert b"/FlateDecode" not in pdf
+
+    first, second = sample_resume.experience[0].description[:2]
+    start = pdf.index(first.encode())
+    block = pdf[pdf.rindex(b"BT", 0, start):pdf.index(b"ET", start)]
+    bullet_size = generator._create_pdf_styles()["ResumeBullet"].fontSize
+    assert second.encode() in block
+    assert f" {bullet_size:g} Tf".encode() in block
+
+
+@pytest.mark.unit
+def test_generate_pdf_compresses_above_threshold(sample_resume, monkeypatch):
+    """Test page compression switches on once the text reaches PDF_COMPRESS_THRESHOLD"""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "PDF_COMPRESS_THRESHOLD", 0)
+    pdf = DocumentGeneratorService().generate_pdf(sample_resume)
+
+    assert b"/FlateDecode" in pdf
+    assert sample_resume.experience[0].description[0].encode() not in pdf
+
+
+@pytest.mark.unit
+def test_generate_docx_paragraph_text_and_styles(sample_resume):
+    """Test the XML-built paragraphs carry their text, list style and run formatting"""
+    import io
+    from docx import Document
+
+    docx_bytes = DocumentGeneratorService().generate_docx(sample_resume)
+    paragraphs = Document(io.BytesIO(docx_bytes)).paragraphs
+
+    name = paragraphs[0]
+    assert name.text == sample_resume.personalInfo.name
+    assert name.alignment == 1  # centered
+    assert name.runs[0].bold
+
+    bullets = [p for p in paragraphs if p.style.name == "List Bullet"]
+    assert [p.text for p in bullets[:2]] == sample_resume.experience[0].description[:2]
+    assert bullets[0].runs[0].font.size.pt == 11
+    assert not bullets[0].runs[0].bold
@@ -3,6 +3,7 @@ Unit tests for health check endpoint
 """
 
 import pytest
+from unittest.mock import AsyncMock, patch
 from fastapi import status
 
 
@@ -47,3 +48,18 @@ def test_root_endpoint(test_client):
     assert "name" in data
     assert "version" in data
     assert data["version"] == "2.0.0"
+
+
+@pytest.mark.unit
+def test_open_resume_probe_is_cached(test_client):
+    """Test that repeated health checks reuse the cached Open Resume result"""
+    from app.api import health
+
+    health._open_resume_cache.update(ts=0.0, val=None)
+    with patch.object(health, "_probe_open_resume_service", new_callable=AsyncMock) as probe:
+        probe.return_value = {"status": "healthy", "response_time_ms": 1.0}
+        test_client.get("/api/health")
+        test_client.get("/api/health")
+
+    assert probe.await_count == 1
+    health._open_resume_cache.update(ts=0.0, val=None)
@@ -20,6 +20,13 @@ def test_personal_info_validation():
     assert info.name == "John Doe"
 
 
+@pytest.mark.unit
+def test_personal_info_rejects_bad_email():
+    """Test that malformed emails fail validation"""
+    with pytest.raises(ValidationError):
+        PersonalInfo(name="John Doe", email="not-an-email")
+
+
 @pytest.mark.unit
 def test_experience_validation():
     """Test Experience model validation"""
@@ -52,3 +59,46 @@ def test_resume_requires_skills():
             ],
             skills=[],
         )
+
+
+@pytest.mark.unit
+def test_resume_requires_experience():
+    """Test that resume requires at least one experience entry"""
+    with pytest.raises(ValidationError):
+        Resume(
+            id="test",
+            name="Test",
+            personalInfo=PersonalInfo(name="John", email="j@example.com"),
+            experience=[],
+            skills=["Python"],
+        )
+
+
+@pytest.mark.unit
+def test_personal_info_safe_filename_stem():
+    """Test that the filename stem replaces spaces and is not serialized"""
+    info = PersonalInfo(name="Jane Q Public", email="jane@example.com")
+    assert info.safe_filename_stem == "Jane_Q_Public"
+    assert "safe_filename_stem" not in info.model_dump()
+
+
+@pytest.mark.unit
+def test_personal_info_safe_filename_stem_keeps_equality_and_tracks_name():
+    """Test that reading the stem neither breaks equality nor goes stale after a rename"""
+    info = PersonalInfo(name="Jane Q Public", email="jane@example.com")
+    twin = PersonalInfo(name="Jane Q Public", email="jane@example.com")
+    assert info.safe_filename_stem == "Jane_Q_Public"
+    assert info == twin
+
+    info.name = "John Roe"
+    assert info.safe_filename_stem == "John_Roe"
+
+
+@pytest.mark.unit
+def test_resume_from_trusted_round_trip(sample_resume):
+    """Test that trusted construction rebuilds nested models from a dump"""
+    data = sample_resume.model_dump(mode="json")
+    resume = Resume.from_trusted(data)
+    assert resume.personalInfo.name == sample_resume.personalInfo.name
+    assert resume.experience[0].company == sample_resume.experience[0].company
+    assert resume.model_dump() == sample_resume.model_dump()
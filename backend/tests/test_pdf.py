@@ -60,6 +60,22 @@ async def test_generate_pdf_endpoint(test_client, sample_resume, mocker):
     assert ".pdf" in response.headers["Content-Disposition"]
 
 
+@pytest.mark.integration
+def test_generate_pdf_serves_repeat_request_from_cache(test_client, sample_resume, mocker):
+    """Test that an identical re-download is served without re-rendering"""
+    mock_generator = mocker.Mock()
+    mock_generator.generate_pdf.return_value = b'%PDF-1.4 fake pdf content'
+    mocker.patch('app.api.pdf.get_template_generator', return_value=mock_generator)
+
+    payload = {"resume": json.loads(sample_resume.model_dump_json()), "template": "default"}
+    first = test_client.post("/api/generate-pdf", json=payload)
+    second = test_client.post("/api/generate-pdf", json=payload)
+
+    assert first.status_code == second.status_code == status.HTTP_200_OK
+    assert second.content == first.content
+    assert mock_generator.generate_pdf.call_count == 1
+
+
 @pytest.mark.integration
 async def test_generate_pdf_service_unavailable(test_client, sample_resume, mocker):
     """Test PDF generation error handling when generation fails"""
@@ -117,3 +133,15 @@ def test_pdf_filename_generation(sample_resume):
     assert "_" in expected_filename
     assert ".pdf" in expected_filename
     assert "John_Doe" in expected_filename
+
+
+@pytest.mark.unit
+def test_content_disposition_handles_non_ascii_names():
+    """Test Content-Disposition keeps an ASCII fallback and an RFC 5987 UTF-8 filename"""
+    from app.api.pdf import _content_disposition
+
+    header = _content_disposition("José_Núñez_Resume_2026-01-01.pdf")
+    header.encode("latin-1")  # must be encodable as an HTTP header
+
+    assert header.startswith('attachment; filename="Jos?_N??ez_Resume_2026-01-01.pdf"')
+    assert "filename*=UTF-8''Jos%C3%A9_N%C3%BA%C3%B1ez_Resume_2026-01-01.pdf" in header
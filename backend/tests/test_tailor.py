@@ -72,7 +72,9 @@ def test_tailor_endpoint_retries_when_unchanged(
     second_response = mocker.MagicMock()
     first_response.text = json.dumps(original_payload)
     second_response.text = json.dumps(updated_payload)
-    mock_client.models.generate_content.side_effect = [first_response, second_response]
+    mock_client.aio.models.generate_content = mocker.AsyncMock(
+        side_effect=[first_response, second_response]
+    )
     mocker.patch("services.gemini.genai.Client", return_value=mock_client)
 
     from services import gemini as gemini_service
@@ -91,7 +93,7 @@ def test_tailor_endpoint_retries_when_unchanged(
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert data["tailoredResume"]["personalInfo"]["summary"] == updated_resume.personalInfo.summary
-    assert mock_client.models.generate_content.call_count == 2
+    assert mock_client.aio.models.generate_content.await_count == 2
 
 
 @pytest.mark.unit
@@ -143,6 +145,46 @@ def test_gemini_service_initialization():
     assert service.model is not None
 
 
+@pytest.mark.unit
+async def test_atailor_resume_awaits_async_client(
+    sample_resume, sample_job_description, mock_gemini_client
+):
+    """Test the async tailoring path goes through the aio client"""
+    from services.gemini import GeminiService
+
+    service = GeminiService()
+    result = await service.atailor_resume(sample_resume, sample_job_description)
+
+    assert result is not None
+    assert mock_gemini_client.aio.models.generate_content.await_count == 1
+    mock_gemini_client.models.generate_content.assert_not_called()
+
+
+@pytest.mark.unit
+async def test_atailor_resume_hands_truncated_reply_to_repair(
+    sample_resume, sample_job_description, mock_gemini_client, mock_gemini_response, mocker
+):
+    """Test a cut-off reply survives SDK response parsing and reaches the JSON repair path"""
+    from google.genai import types
+    from services.gemini import GeminiService
+
+    truncated = json.dumps(mock_gemini_response)[:-40]
+
+    async def fake_generate(**kwargs):
+        return types.GenerateContentResponse._from_response(
+            {"candidates": [{"content": {"parts": [{"text": truncated}]}}]}, kwargs
+        )
+
+    mock_gemini_client.aio.models.generate_content.side_effect = fake_generate
+
+    service = GeminiService()
+    parse = mocker.spy(service, "_parse_json_response")
+    await service.atailor_resume(sample_resume, sample_job_description)
+
+    parse.assert_called_once_with(truncated)
+    assert mock_gemini_client.aio.models.generate_content.call_count == 1
+
+
 @pytest.mark.unit
 def test_keyword_extraction_from_resume(sample_resume):
     """Test extracting text from resume"""
@@ -257,3 +299,424 @@ def test_full_tailoring_flow(test_client, sample_resume, sample_job_description,
     
     # Verify changes recorded
     assert len(data["changes"]) > 0
+
+
+@pytest.mark.unit
+def test_tailor_endpoint_serves_repeat_request_from_cache(
+    test_client, sample_resume, sample_job_description, mock_gemini_client
+):
+    """Test an identical resubmission is answered without calling Gemini again"""
+    from app.config import settings
+    from services import gemini as gemini_service
+
+    settings.GEMINI_API_KEY = "test-key-cache"
+    gemini_service._gemini_service = None
+
+    payload = {
+        "resume": json.loads(sample_resume.model_dump_json()),
+        "jobDescription": sample_job_description,
+    }
+    first = test_client.post("/api/tailor", json=payload)
+    payload["jobDescription"] = "  " + sample_job_description.upper() + "\n"
+    second = test_client.post("/api/tailor", json=payload)
+
+    assert first.status_code == status.HTTP_200_OK
+    assert second.json() == first.json()
+    assert mock_gemini_client.aio.models.generate_content.await_count == 1
+
+
+@pytest.mark.unit
+def test_tailor_cache_hit_is_restamped_for_the_requester(
+    test_client, sample_resume, sample_job_description, mock_gemini_client
+):
+    """Test a cache hit carries the second resume's id, not the first submitter's"""
+    from app.config import settings
+    from services import gemini as gemini_service
+
+    settings.GEMINI_API_KEY = "test-key-cache-id"
+    gemini_service._gemini_service = None
+
+    first_resume = json.loads(sample_resume.model_dump_json())
+    second_resume = dict(first_resume, id="other-resume-002")
+    first = test_client.post(
+        "/api/tailor", json={"resume": first_resume, "jobDescription": sample_job_description}
+    )
+    second = test_client.post(
+        "/api/tailor", json={"resume": second_resume, "jobDescription": sample_job_description}
+    )
+
+    assert mock_gemini_client.aio.models.generate_content.await_count == 1
+    assert first.json()["tailoredResume"]["id"] == first_resume["id"]
+    assert second.json()["tailoredResume"]["id"] == "other-resume-002"
+    assert second.json()["atsScore"] == first.json()["atsScore"]
+
+
+@pytest.mark.unit
+async def test_adaptive_limiter_halves_on_rate_limit_and_recovers():
+    """Test the Gemini limiter backs off on 429s and grows back on success"""
+    from utils.rate_limit import AdaptiveLimiter
+
+    limiter = AdaptiveLimiter(max_concurrency=4, rpm=0)
+    await limiter.acquire()
+    assert limiter.in_flight == 1
+
+    limiter.release(rate_limited=True)
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+    await limiter.acquire()
+    limiter.release()
+    assert limiter.limit == 3
+
+
+@pytest.mark.unit
+async def test_adaptive_limiter_serves_waiters_in_order_and_survives_cancellation():
+    """Test queued callers get slots first come, first served and a cancelled wait leaks nothing"""
+    import asyncio
+    from utils.rate_limit import AdaptiveLimiter
+
+    limiter = AdaptiveLimiter(max_concurrency=1, rpm=0)
+    await limiter.acquire()
+
+    order = []
+
+    async def worker(name):
+        await limiter.acquire()
+        order.append(name)
+        limiter.release()
+
+    cancelled = asyncio.create_task(worker("cancelled"))
+    first = asyncio.create_task(worker("first"))
+    second = asyncio.create_task(worker("second"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+
+    limiter.release()
+    await asyncio.gather(first, second)
+
+    assert order == ["first", "second"]
+    assert cancelled.cancelled()
+    assert limiter.in_flight == 0
+    assert limiter.snapshot()["waiting"] == 0
+
+
+@pytest.mark.unit
+def test_tailor_stream_endpoint_emits_progress_keywords_and_result(
+    test_client, sample_resume, sample_job_description, mock_gemini_client, mock_gemini_response
+):
+    """Test the SSE endpoint streams partial keywords before the final result"""
+    from google.genai import types
+    from app.config import settings
+    from services import gemini as gemini_service
+
+    settings.GEMINI_API_KEY = "test-key-stream"
+    gemini_service._gemini_service = None
+
+    body = json.dumps(mock_gemini_response)
+    chunks = [body[i:i + 200] for i in range(0, len(body), 200)]
+
+    def fake_stream(**kwargs):
+        # Parse each chunk the way the SDK does, against the config actually sent
+        for text in chunks:
+            yield types.GenerateContentResponse._from_response(
+                {"candidates": [{"content": {"parts": [{"text": text}]}}]}, kwargs
+            )
+
+    mock_gemini_client.models.generate_content_stream = fake_stream
+
+    response = test_client.post(
+        "/api/tailor/stream",
+        json={
+            "resume": json.loads(sample_resume.model_dump_json()),
+            "jobDescription": sample_job_description,
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        line.split(": ", 1)[1]
+        for line in response.text.splitlines()
+        if line.startswith("event: ")
+    ]
+    assert events[0] == "progress"
+    assert "keywords" in events
+    assert events[-1] == "result"
+    assert events.index("keywords") < events.index("result")
+
+
+@pytest.mark.unit
+async def test_atailor_resume_stream_keeps_event_loop_running(
+    sample_resume, sample_job_description, mock_gemini_client, mock_gemini_response
+):
+    """Test a slow blocking SDK stream is drained off the event loop thread"""
+    import asyncio
+    import time
+    from types import SimpleNamespace
+    from services.gemini import GeminiService
+
+    body = json.dumps(mock_gemini_response)
+    chunks = [body[i:i + 100] for i in range(0, len(body), 100)]
+
+    def slow_stream(**kwargs):
+        for text in chunks:
+            time.sleep(0.02)
+            yield SimpleNamespace(text=text)
+
+    mock_gemini_client.models.generate_content_stream = slow_stream
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    service = GeminiService()
+    events = [event async for event in service.atailor_resume_stream(sample_resume, sample_job_description)]
+    ticker_task.cancel()
+
+    assert events[-1]["event"] == "result"
+    # Blocking the loop for the whole stream would leave the ticker at (almost) zero
+    assert ticks >= len(chunks)
+
+
+@pytest.mark.unit
+async def test_atailor_resume_stream_times_out_on_stalled_stream(
+    sample_resume, sample_job_description, mock_gemini_client, monkeypatch
+):
+    """Test the stream deadline fires even while the SDK is blocked reading"""
+    import threading
+    from types import SimpleNamespace
+    from app.config import settings
+    from services.gemini import GeminiService, gemini_limiter
+
+    monkeypatch.setattr(settings, "GEMINI_TIMEOUT", 0.1)
+    release = threading.Event()
+
+    def stalled_stream(**kwargs):
+        yield SimpleNamespace(text='{"matchedKeywords": [')
+        release.wait(5)
+
+    mock_gemini_client.models.generate_content_stream = stalled_stream
+
+    service = GeminiService()
+    events = [event async for event in service.atailor_resume_stream(sample_resume, sample_job_description)]
+    release.set()
+
+    assert events[-1] == {"event": "error", "data": {"message": "Gemini API call timed out"}}
+    assert gemini_limiter.in_flight == 0
+
+
+@pytest.mark.unit
+async def test_atailor_resume_stream_finds_keywords_split_across_sse_chunks(
+    sample_resume, sample_job_description, mock_gemini_response, mocker, monkeypatch
+):
+    """Test keyword scanning over a real SDK stream whose chunks split the key and array"""
+    import time
+    from app.config import settings
+    from services.gemini import GeminiService
+
+    monkeypatch.setattr(settings, "GEMINI_API_KEY", "test-key-sse")
+    monkeypatch.setattr(settings, "GEMINI_MODEL", "gemini-test")
+
+    reply = dict(mock_gemini_response)
+    body = json.dumps({"matchedKeywords": reply.pop("matchedKeywords"), **reply})
+    # Cut inside the key and inside the array so neither arrives in one piece
+    cuts = [0, 8, body.index("[") + 3, body.index("]") - 2, body.index("]") + 40, len(body)]
+    lines = [
+        b"data: " + json.dumps({"candidates": [{"content": {"parts": [{"text": body[a:b]}]}}]}).encode()
+        for a, b in zip(cuts, cuts[1:])
+    ]
+
+    class FakeSSEResponse:
+        status_code = 200
+        headers = {"content-type": "text/event-stream"}
+
+        def iter_lines(self):
+            for line in lines:
+                time.sleep(0.01)
+                yield line
+                yield b""
+
+    send = mocker.patch("requests.Session.send", return_value=FakeSSEResponse())
+
+    service = GeminiService()
+    events = [event async for event in service.atailor_resume_stream(sample_resume, sample_job_description)]
+    names = [event["event"] for event in events]
+
+    assert send.call_count == 1
+    assert names.count("keywords") == 1
+    assert names.count("progress") == len(lines)
+    keywords = events[names.index("keywords")]["data"]["matchedKeywords"]
+    assert keywords == mock_gemini_response["matchedKeywords"]
+    assert names.index("keywords") < names.index("result")
+
+
+@pytest.mark.unit
+async def test_atailor_resume_by_section_merges_parallel_sections(
+    sample_resume, sample_job_description, mock_gemini_client
+):
+    """Test section-parallel tailoring merges each section and scores keywords locally"""
+    from services.gemini import GeminiService
+
+    replies = {
+        "Extract key requirements": {"technical_skills": ["Python", "Kubernetes"], "soft_skills": []},
+        "SUMMARY section": {"summary": "Python engineer focused on APIs", "changes": ["Rewrote summary"]},
+        "SKILLS section": {"skills": {"Languages": ["Python"]}, "changes": [], "suggestions": ["Learn Kubernetes"]},
+    }
+
+    async def fake_generate(**kwargs):
+        prompt = kwargs["contents"].parts[0].text
+        for marker, payload in replies.items():
+            if marker in prompt:
+                return SimpleNamespace(text=json.dumps(payload))
+        return SimpleNamespace(text="{}")
+
+    mock_gemini_client.aio.models.generate_content.side_effect = fake_generate
+
+    service = GeminiService()
+    result = await service.atailor_resume_by_section(sample_resume, sample_job_description)
+
+    assert result.tailoredResume.personalInfo.summary == "Python engineer focused on APIs"
+    assert result.tailoredResume.skills == {"Languages": ["Python"]}
+    assert result.tailoredResume.experience == sample_resume.experience
+    assert result.matchedKeywords == ["Python"]
+    assert result.missingKeywords == ["Kubernetes"]
+    assert result.suggestions == ["Learn Kubernetes"]
+
+
+@pytest.mark.unit
+async def test_aextract_keywords_reuses_cached_reply(sample_job_description, mock_gemini_client):
+    """Test a repeated job description is only sent to Gemini once"""
+    from services.gemini import GeminiService
+
+    mock_gemini_client.aio.models.generate_content.return_value = SimpleNamespace(
+        text=json.dumps({"technical_skills": ["Python"], "soft_skills": ["Leadership"]})
+    )
+
+    service = GeminiService()
+    first = await service.aextract_keywords(sample_job_description)
+    second = await service.aextract_keywords(sample_job_description)
+
+    assert first == second == ["Python", "Leadership"]
+    assert mock_gemini_client.aio.models.generate_content.await_count == 1
+
+
+@pytest.mark.unit
+def test_async_artifact_writer_writes_queued_files(tmp_path):
+    """Test queued artifact writes land on disk after flush"""
+    from utils.async_writer import AsyncArtifactWriter
+
+    writer = AsyncArtifactWriter(max_batch=2)
+    for i in range(3):
+        writer.enqueue(tmp_path / f"artifact_{i}.json", f'{{"n": {i}}}'.encode())
+    writer.flush()
+
+    assert [json.loads((tmp_path / f"artifact_{i}.json").read_text())["n"] for i in range(3)] == [0, 1, 2]
+
+
+@pytest.mark.unit
+def test_tailor_endpoint_rejects_when_saturated(
+    test_client, sample_resume, sample_job_description, monkeypatch
+):
+    """Test /tailor answers 503 with Retry-After once the concurrency cap is reached"""
+    from app.api import tailor
+
+    monkeypatch.setattr(tailor._tailor_limiter, "in_flight", tailor._tailor_limiter.max_in_flight)
+
+    response = test_client.post(
+        "/api/tailor",
+        json={
+            "resume": json.loads(sample_resume.model_dump_json()),
+            "jobDescription": sample_job_description,
+        },
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "5"
+
+
+@pytest.mark.unit
+def test_tailor_status_probe_is_cached(test_client, mocker):
+    """Test /tailor/status reuses its probe until invalidated"""
+    from app.api import tailor
+
+    tailor._invalidate_status_cache()
+    probe = mocker.patch.object(
+        tailor,
+        "_probe_tailor_service",
+        return_value=(status.HTTP_200_OK, {"status": "available", "model": "m", "message": "ok"}),
+    )
+
+    test_client.get("/api/tailor/status")
+    response = test_client.get("/api/tailor/status")
+    assert probe.call_count == 1
+    assert "in_flight_tailors" in response.json()
+
+    tailor._invalidate_status_cache()
+    test_client.get("/api/tailor/status")
+    assert probe.call_count == 2
+    tailor._invalidate_status_cache()
+
+
+@pytest.mark.unit
+def test_merge_clips_overlong_ai_bullets_to_model_limit(sample_resume):
+    """Test AI bullets over the BulletStr cap are cut so the tailored resume still validates"""
+    from models.resume import BULLET_MAX_LENGTH, Resume
+    from services.gemini import GeminiService
+
+    service = GeminiService()
+    company = sample_resume.experience[0].company
+    tailored = {"experiences": [{"company": company, "description": ["word " * 400, "  short  "]}]}
+    merged = service._merge_tailored_content(sample_resume, tailored)
+
+    long_bullet, short_bullet = merged.experience[0].description
+    assert len(long_bullet) <= BULLET_MAX_LENGTH
+    assert long_bullet.endswith("word")
+    assert short_bullet == "short"
+    Resume.model_validate_json(merged.model_dump_json())
+
+
+@pytest.mark.unit
+def test_match_keywords_uses_whole_tokens(sample_resume):
+    """Test single-word keywords match whole tokens while phrases match as substrings"""
+    from services.gemini import GeminiService
+
+    service = GeminiService()
+    matched, missing = service._match_keywords(
+        ["Go", "C++", "Node.js", "CI/CD", "Python"],
+        "good c++ and node.js skills, ci/cd pipelines in python.",
+    )
+
+    assert matched == ["C++", "Node.js", "CI/CD", "Python"]
+    assert missing == ["Go"]
+
+
+@pytest.mark.unit
+async def test_rate_limited_key_rotates_to_next_key(mocker, monkeypatch):
+    """Test a 429 on one API key cools it down and the retry goes to another key"""
+    from app.config import settings
+    from services.gemini import GeminiService
+
+    monkeypatch.setattr(settings, "GEMINI_API_KEYS", "second-key")
+    monkeypatch.setattr(settings, "GEMINI_RETRY_DELAY", 0)
+
+    limited, healthy = mocker.MagicMock(), mocker.MagicMock()
+    limited.aio.models.generate_content = mocker.AsyncMock(
+        side_effect=RuntimeError("429 RESOURCE_EXHAUSTED")
+    )
+    healthy.aio.models.generate_content = mocker.AsyncMock(
+        return_value=SimpleNamespace(text='{"ok": true}')
+    )
+    mocker.patch("services.gemini.genai.Client", side_effect=[limited, healthy])
+
+    service = GeminiService()
+    response_text = await service._amake_request("prompt")
+
+    assert response_text == '{"ok": true}'
+    assert limited.aio.models.generate_content.await_count == 1
+    assert service._pick_client()[1] is healthy
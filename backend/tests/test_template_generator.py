@@ -56,3 +56,12 @@ def test_prepare_template_data_maps_bullets():
     assert exp_entry["bullets"] == ["Bullet point 1", "Bullet point 2"]
     # Ensure description is still there (optional, but good for completeness)
     assert exp_entry["description"] == ["Bullet point 1", "Bullet point 2"]
+
+
+@pytest.mark.unit
+def test_get_template_generator_reuses_default_instance():
+    """Test that the default template generator is created once and reused"""
+    from services.template_document_generator import get_template_generator
+
+    assert get_template_generator() is get_template_generator()
+    assert get_template_generator(template_dir=os.path.dirname(__file__)) is not get_template_generator()
@@ -4,8 +4,8 @@ Debug script to test WeasyPrint directly.
 import sys
 import os
 
-# Add backend to python path
-sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+# Add backend/src to python path so models load under the same names the app uses
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend", "src"))
 
 print("=" * 60)
 print("WeasyPrint Debug Script")
@@ -75,7 +75,7 @@ except Exception as e:
 print("\n[Test 4] Rendering actual Manish Style template...")
 try:
     from jinja2 import Environment, FileSystemLoader
-    from src.models.resume import Resume
+    from models.resume import Resume
     import json
 
     # Load a sample JSON
@@ -85,7 +85,7 @@ try:
         data = json.load(f)
     
     resume_data = data["tailoredResume"]
-    resume = Resume(**resume_data)
+    resume = Resume.from_trusted(resume_data)
     
     # Setup Jinja2
     template_dir = "backend/templates"
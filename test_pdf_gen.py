@@ -3,11 +3,11 @@ import json
 import os
 import sys
 
-# Add backend to python path
-sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+# Add backend/src to python path so models load under the same names the app uses
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend", "src"))
 
-from src.models.resume import Resume
-from src.services.template_document_generator import get_template_generator
+from models.resume import Resume
+from services.template_document_generator import get_template_generator
 
 def generate_pdf_from_json():
     import tkinter as tk
@@ -47,9 +47,9 @@ def generate_pdf_from_json():
 
         resume_data = data["tailoredResume"]
         
-        # Instantiate Resume model
+        # Saved artifacts were validated when written; skip re-validation
         print("Parsing JSON data into Resume model...")
-        resume = Resume(**resume_data)
+        resume = Resume.from_trusted(resume_data)
         
         # Initialize the generator
         print("Initializing TemplateDocumentGenerator...")